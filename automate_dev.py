@@ -35,7 +35,7 @@ from config import (
     PERFORMANCE_LOGGING_ENABLED, PERFORMANCE_LOG_THRESHOLD_MS
 )
 from task_tracker import TaskTracker
-from command_executor import run_claude_command, execute_command_and_get_status
+from command_executor import run_claude_command, execute_command_and_get_status, USAGE_LIMIT_WAIT_INTERRUPT
 from signal_handler import wait_for_signal_file, cleanup_signal_file
 from usage_limit import parse_usage_limit_error, calculate_wait_time
 
@@ -187,7 +187,7 @@ def _execute_graceful_shutdown(signum: int, frame: Optional[types.FrameType],
     """Execute graceful shutdown operations.
     
     This function handles the core shutdown logic including:
-    - Setting global shutdown flag
+    - Setting global shutdown flag and interrupting usage limit waits
     - Updating test state if in test mode
     - Saving state to file if requested
     - Executing cleanup callback if provided
@@ -210,8 +210,9 @@ def _execute_graceful_shutdown(signum: int, frame: Optional[types.FrameType],
             extra={"component": "shutdown", "signal": signum, "signal_name": signal_name}
         )
     
-    # Set global shutdown flag
+    # Set global shutdown flag and wake any pending usage limit wait
     SHUTDOWN_REQUESTED = True
+    USAGE_LIMIT_WAIT_INTERRUPT.set()
     
     # Update test state if in test mode
     _update_test_state()
@@ -1110,28 +1111,29 @@ def _find_status_files() -> List[Path]:
         List[Path]: List of Path objects for all status files found, 
                    or empty list if none exist or directory is missing.
                    
-    Raises:
-        OSError: If directory access permissions are insufficient (rare case).
+    Note:
+        A missing directory and permission or filesystem errors are all
+        reported as an empty list rather than raised.
     """
-    claude_dir = Path('.claude')
-    
-    # Handle missing .claude directory gracefully
-    if not claude_dir.exists():
-        return []
-    
     try:
-        # Find all status files using glob pattern
-        return list(claude_dir.glob('status_*.json'))
+        # One directory read; names are matched directly instead of via glob
+        with os.scandir('.claude') as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith('status_') and entry.name.endswith('.json')
+            ]
     except OSError:
-        # Handle rare permission or filesystem issues
+        # Missing .claude directory, or rare permission or filesystem issues
         return []
 
 
 def _get_newest_file(status_files: List[Path]) -> Optional[Path]:
     """Determine which status file is newest based on lexicographic timestamp sorting.
     
-    Status files follow the pattern 'status_YYYYMMDD_HHMMSS.json' where timestamps
-    are embedded in filenames. Lexicographic sorting naturally orders them chronologically.
+    Status files follow the pattern 'status_YYYYMMDD_HHMMSS_NNNNNN.json' where timestamps
+    and a per-server sequence number are embedded in filenames. Lexicographic sorting
+    naturally orders them chronologically, including files written in the same second.
     
     Args:
         status_files (List[Path]): List of status file paths to sort.
@@ -1176,10 +1178,12 @@ def _read_status_file(status_file: Path) -> Optional[str]:
     Note:
         This function expects JSON files with at least a 'status' field.
         Missing 'status' fields return None rather than raising KeyError.
+        The file is read as bytes in one call and parsed with json.loads.
     """
     try:
-        with open(status_file, 'r', encoding='utf-8') as f:
-            status_data = json.load(f)
+        with open(status_file, 'rb') as f:
+            raw_data = f.read()
+        status_data = json.loads(raw_data)
         return status_data.get('status')
     except (json.JSONDecodeError, IOError, OSError, UnicodeDecodeError):
         # Handle JSON parsing, file I/O, and encoding errors gracefully
@@ -1460,6 +1464,9 @@ def main(dependencies: Optional[Dependencies] = None) -> None:
     # Set up logging first
     _get_dependency(dependencies, 'LOGGER_SETUP')()
     
+    # A shutdown from an earlier run in this process must not cut short this run's waits
+    USAGE_LIMIT_WAIT_INTERRUPT.clear()
+    
     # Get logger after setup (may be None if mocked)
     logger = LOGGERS.get('orchestrator')
     if logger:
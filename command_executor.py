@@ -5,15 +5,30 @@ their completion and error conditions.
 """
 
 import json
+import logging
 import random
 import subprocess
+import threading
 import time
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, TypedDict
 
-from config import SIGNAL_FILE, LOGGERS
+from config import (
+    SIGNAL_FILE, LOGGERS,
+    USAGE_LIMIT_WAIT_CHUNK_SECONDS, USAGE_LIMIT_WAIT_JITTER_SECONDS
+)
 from usage_limit import parse_usage_limit_error, calculate_wait_time
-from signal_handler import wait_for_signal_file
+from signal_handler import cleanup_signal_file, wait_for_signal_file
+
+
+# Set by the shutdown handlers to abort a pending usage limit wait
+USAGE_LIMIT_WAIT_INTERRUPT = threading.Event()
+
+# Lowercase marker searched for in raw (bytes) subprocess output
+USAGE_LIMIT_MARKER = b"usage limit"
+
+# Flags passed to every Claude CLI invocation, after "-p <command>"
+CLAUDE_CLI_BASE_FLAGS = ("--output-format", "json", "--dangerously-skip-permissions")
 
 
 class RetryConfig(TypedDict, total=False):
@@ -97,49 +112,51 @@ class CircuitState:
 
 
 # Exception hierarchy for command execution errors
-def _format_error_message(error_type: str, message: str, command: str = "") -> str:
-    """Format error message with consistent pattern across all exception types.
-    
-    Creates standardized error messages in the format:
-    "[ERROR_TYPE]: {message} - Command: {command}" when command is provided
-    "[ERROR_TYPE]: {message}" when no command is provided
-    
-    Args:
-        error_type: The type of error (e.g., "COMMAND_EXECUTION", "JSON_PARSE")
-        message: The detailed error message
-        command: Optional command context for debugging
-        
-    Returns:
-        Formatted error message string with consistent structure
-        
-    Example:
-        >>> _format_error_message("COMMAND_EXECUTION", "Failed to run command", "/continue")
-        "[COMMAND_EXECUTION]: Failed to run command - Command: /continue"
-        >>> _format_error_message("JSON_PARSE", "Invalid JSON response")
-        "[JSON_PARSE]: Invalid JSON response"
-    """
-    if command:
-        return f"[{error_type}]: {message} - Command: {command}"
-    else:
-        return f"[{error_type}]: {message}"
+#
+# Error messages follow the pattern "[ERROR_TYPE]: {message} - Command: {command}",
+# or "[ERROR_TYPE]: {message}" when no command is given. The templates are
+# specialized per error type once at import so raising an exception is a single
+# %-format with no helper call.
+COMMAND_EXECUTION_ERROR_FORMAT = "[COMMAND_EXECUTION]: %s - Command: %s"
+COMMAND_EXECUTION_ERROR_FORMAT_NO_COMMAND = "[COMMAND_EXECUTION]: %s"
+JSON_PARSE_ERROR_FORMAT = "[JSON_PARSE]: %s - Command: %s"
+JSON_PARSE_ERROR_FORMAT_NO_COMMAND = "[JSON_PARSE]: %s"
+COMMAND_TIMEOUT_ERROR_FORMAT = "[COMMAND_TIMEOUT]: %s - Command: %s"
+COMMAND_TIMEOUT_ERROR_FORMAT_NO_COMMAND = "[COMMAND_TIMEOUT]: %s"
 
 
 class CommandExecutionError(Exception):
     """Exception raised when Claude CLI command execution fails."""
     def __init__(self, message: str, command: str = ""):
-        super().__init__(_format_error_message("COMMAND_EXECUTION", message, command))
+        super().__init__(
+            COMMAND_EXECUTION_ERROR_FORMAT % (message, command) if command
+            else COMMAND_EXECUTION_ERROR_FORMAT_NO_COMMAND % (message,)
+        )
+
+
+class ShutdownInterruptedError(CommandExecutionError):
+    """Exception raised when a shutdown request aborts command execution.
+    
+    Never retried: relaunching the Claude CLI would defeat the shutdown.
+    """
 
 
 class JSONParseError(Exception):
     """Exception raised when JSON parsing fails."""
     def __init__(self, message: str, command: str = ""):
-        super().__init__(_format_error_message("JSON_PARSE", message, command))
+        super().__init__(
+            JSON_PARSE_ERROR_FORMAT % (message, command) if command
+            else JSON_PARSE_ERROR_FORMAT_NO_COMMAND % (message,)
+        )
 
 
 class CommandTimeoutError(Exception):
     """Exception raised when commands timeout waiting for completion signal."""
     def __init__(self, message: str, command: str = ""):
-        super().__init__(_format_error_message("COMMAND_TIMEOUT", message, command))
+        super().__init__(
+            COMMAND_TIMEOUT_ERROR_FORMAT % (message, command) if command
+            else COMMAND_TIMEOUT_ERROR_FORMAT_NO_COMMAND % (message,)
+        )
 
 
 def _get_default_retry_config() -> RetryConfig:
@@ -188,6 +205,10 @@ def _is_retryable_error(exception: Exception, retryable_exceptions: tuple) -> bo
     if isinstance(exception, json.JSONDecodeError) or isinstance(exception, JSONParseError):
         return False
     
+    # A shutdown request must stop the command, not relaunch it
+    if isinstance(exception, ShutdownInterruptedError):
+        return False
+    
     # Check if exception type is in retryable list
     return isinstance(exception, retryable_exceptions)
 
@@ -338,9 +359,10 @@ def _execute_command_with_signal_wait(command_array: List[str], command: str, de
     
     This function encapsulates the core command execution logic that was
     previously embedded in the retry loop. It handles:
-    1. Subprocess execution
-    2. Signal file waiting
-    3. Combining any errors from both operations
+    1. Clearing any stale signal file from an earlier command
+    2. Subprocess execution
+    3. Signal file waiting
+    4. Combining any errors from both operations
     
     Args:
         command_array: The complete command array to execute
@@ -359,6 +381,9 @@ def _execute_command_with_signal_wait(command_array: List[str], command: str, de
     subprocess_exception = None
     result = None
     
+    # A leftover signal would satisfy the wait below instantly and hide a timeout
+    cleanup_signal_file(SIGNAL_FILE)
+    
     try:
         # Execute the Claude CLI command
         result = _execute_claude_subprocess(command_array, command, debug=debug)
@@ -413,27 +438,20 @@ def _execute_claude_command_core(command: str, args: Optional[List[str]] = None,
         if logger:
             logger.debug(f"Additional arguments: {args}")
     
-    # Construct the base command array with required flags
-    command_array = [
-        "claude",
-        "-p", command,
-        "--output-format", "json",
-        "--dangerously-skip-permissions"
-    ]
-    
-    # Append additional args if provided
+    # Construct the command array in one allocation from the shared base flags
     if args:
-        command_array.extend(args)
+        command_array = ["claude", "-p", command, *CLAUDE_CLI_BASE_FLAGS, *args]
+    else:
+        command_array = ["claude", "-p", command, *CLAUDE_CLI_BASE_FLAGS]
     
-    if logger:
+    if logger and logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"Full command array: {command_array}")
     
     # Execute command with signal waiting
     result = _execute_command_with_signal_wait(command_array, command, debug=debug)
     
     # Check for usage limit errors in stdout or stderr and handle retry if needed
-    output_to_check = result.stdout + " " + result.stderr
-    if "usage limit" in output_to_check.lower():
+    if USAGE_LIMIT_MARKER in result.stdout.lower() or USAGE_LIMIT_MARKER in result.stderr.lower():
         if logger:
             logger.warning("Usage limit detected, initiating retry workflow")
         result = _handle_usage_limit_and_retry(command, command_array, result, debug=debug)
@@ -458,17 +476,20 @@ def _handle_usage_limit_and_retry(command: str, command_array: List[str],
         This function handles the complete usage limit workflow:
         1. Parse usage limit error from initial result
         2. Calculate wait time until reset
-        3. Wait for the specified duration
-        4. Wait for signal file from first attempt
-        5. Retry the command execution
+        3. Wait for the specified duration (interruptible by shutdown)
+        4. Retry the command execution and wait for its completion signal
+           (the initial attempt's signal was already consumed by its own wait)
+
+    Raises:
+        ShutdownInterruptedError: If a shutdown request interrupts the wait
     """
     logger = LOGGERS.get('usage_limit')
     
     if logger:
         logger.warning(f"Usage limit detected for command '{command}', initiating retry workflow")
     
-    # Parse usage limit error
-    output_to_check = result.stdout + " " + result.stderr
+    # Parse usage limit error (output is only decoded on this rare path)
+    output_to_check = _decode_output(result.stdout + b" " + result.stderr)
     parsed_info = parse_usage_limit_error(output_to_check)
     if logger:
         logger.debug(f"Parsed usage limit info: {parsed_info}")
@@ -483,17 +504,44 @@ def _handle_usage_limit_and_retry(command: str, command_array: List[str],
     if logger:
         logger.info(message)
     print(message)  # Keep user-facing message for visibility
-    time.sleep(wait_seconds)
-    
-    # Wait for signal file from first attempt
-    if logger:
-        logger.debug("Waiting for signal file from initial command attempt")
-    _wait_for_completion_with_context(command, debug=debug)
-    
+    if not _wait_for_usage_limit_reset(wait_seconds):
+        error_msg = "Usage limit wait interrupted by shutdown request"
+        if logger:
+            logger.warning(f"{error_msg} for command '{command}'")
+        raise ShutdownInterruptedError(error_msg, command)
+
     # Retry the command
     if logger:
         logger.info(f"Retrying command '{command}' after usage limit wait")
-    return _execute_claude_subprocess(command_array, command, debug=debug)
+    return _execute_command_with_signal_wait(command_array, command, debug=debug)
+
+
+def _wait_for_usage_limit_reset(wait_seconds: float) -> bool:
+    """Wait until the usage limit resets, waking periodically to check for shutdown.
+
+    The wait runs against a time.monotonic() deadline in bounded chunks of
+    USAGE_LIMIT_WAIT_CHUNK_SECONDS plus random jitter, so a shutdown request
+    aborts it promptly. A random offset of up to USAGE_LIMIT_WAIT_JITTER_SECONDS
+    is added past the reset time so that orchestrators waiting on the same
+    reset do not all retry at the same instant.
+
+    Args:
+        wait_seconds: Seconds until the usage limit resets
+
+    Returns:
+        True if the full wait elapsed, False if interrupted via USAGE_LIMIT_WAIT_INTERRUPT
+    """
+    jitter = random.uniform(0, USAGE_LIMIT_WAIT_JITTER_SECONDS)
+    deadline = time.monotonic() + max(0.0, wait_seconds) + jitter
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+
+        chunk = min(remaining, USAGE_LIMIT_WAIT_CHUNK_SECONDS + random.uniform(0, USAGE_LIMIT_WAIT_JITTER_SECONDS))
+        if USAGE_LIMIT_WAIT_INTERRUPT.wait(chunk):
+            return False
 
 
 def _wait_for_completion_with_context(command: str, debug: bool = False) -> None:
@@ -513,7 +561,7 @@ def _wait_for_completion_with_context(command: str, debug: bool = False) -> None
     except TimeoutError as e:
         error_msg = f"Claude command timed out waiting for completion signal"
         if error_logger:
-            error_logger.error(f"[COMMAND_TIMEOUT]: {error_msg} - Command: {command}")
+            error_logger.error(COMMAND_TIMEOUT_ERROR_FORMAT % (error_msg, command))
         raise CommandTimeoutError(error_msg, command) from e
 
 
@@ -526,7 +574,8 @@ def _execute_claude_subprocess(command_array: List[str], command: str, debug: bo
         debug: Whether to enable debug logging
         
     Returns:
-        subprocess.CompletedProcess object with stdout, stderr, and returncode
+        subprocess.CompletedProcess object with stdout, stderr, and returncode.
+        stdout and stderr are raw bytes; callers decode only what they need.
         
     Raises:
         CommandExecutionError: If subprocess execution fails
@@ -534,36 +583,46 @@ def _execute_claude_subprocess(command_array: List[str], command: str, debug: bo
     logger = LOGGERS.get('command_executor')
     error_logger = LOGGERS.get('error_handler')
     
-    cmd_str = ' '.join(command_array)
-    if logger:
-        logger.debug(f"Executing subprocess: {cmd_str}")
+    # Only build debug strings when DEBUG is enabled for this logger
+    debug_enabled = bool(logger) and logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug(f"Executing subprocess: {' '.join(command_array)}")
     
     try:
         result = subprocess.run(
             command_array,
-            capture_output=True,
-            text=True,
+            capture_output=True,  # Raw bytes: no decode pass over large outputs
             check=False  # Don't raise on non-zero exit codes
         )
         
-        if logger:
+        if debug_enabled:
             logger.debug(f"Subprocess completed with return code: {result.returncode}")
-        if result.stderr:
-            if logger:
-                logger.debug(f"Subprocess stderr: {result.stderr}")
-        if result.stdout:
-            if logger:
-                logger.debug(f"Subprocess stdout length: {len(result.stdout)} characters")
+            if result.stderr:
+                logger.debug(f"Subprocess stderr: {_decode_output(result.stderr)}")
+            if result.stdout:
+                logger.debug(f"Subprocess stdout length: {len(result.stdout)} bytes")
         
         return result
         
     except subprocess.SubprocessError as e:
         error_msg = f"Failed to execute Claude CLI command"
         if error_logger:
-            error_logger.error(f"[COMMAND_EXECUTION]: {error_msg} - Command: {command}")
+            error_logger.error(COMMAND_EXECUTION_ERROR_FORMAT % (error_msg, command))
         raise CommandExecutionError(error_msg, command) from e
 
 
+def _decode_output(output: bytes) -> str:
+    """Decode raw subprocess output as UTF-8, replacing invalid bytes.
+    
+    Args:
+        output: Raw stdout or stderr bytes from the Claude CLI
+        
+    Returns:
+        Decoded text suitable for parsing and logging
+    """
+    return output.decode('utf-8', errors='replace')
+
+
 def run_claude_command(command: str, args: Optional[List[str]] = None, 
                       debug: bool = False, retry_config: Optional[RetryConfig] = None) -> Dict[str, Any]:
     """Execute a Claude CLI command and return parsed JSON output.
@@ -585,6 +644,8 @@ def run_claude_command(command: str, args: Optional[List[str]] = None,
         CommandExecutionError: If Claude CLI execution fails after all retries
         JSONParseError: If Claude CLI output is not valid JSON (not retried)
         CommandTimeoutError: If signal file doesn't appear within timeout period
+        ShutdownInterruptedError: If a shutdown request interrupts a usage limit
+            wait (not retried)
         
     Note:
         This function relies on the Stop hook configuration in .claude/settings.local.json
@@ -607,9 +668,10 @@ def run_claude_command(command: str, args: Optional[List[str]] = None,
     
     # Parse JSON output from stdout
     try:
-        if logger:
-            logger.debug(f"Parsing JSON output ({len(result.stdout)} characters)")
+        if logger and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Parsing JSON output ({len(result.stdout)} bytes)")
         
+        # json.loads accepts the raw UTF-8 bytes directly
         parsed_result = json.loads(result.stdout)
         if logger:
             logger.info(f"Successfully executed Claude command '{command}'")
@@ -618,7 +680,7 @@ def run_claude_command(command: str, args: Optional[List[str]] = None,
         error_logger = LOGGERS.get('error_handler')
         error_msg = f"Failed to parse Claude CLI JSON output"
         if error_logger:
-            error_logger.error(f"[JSON_PARSE]: {error_msg} - Command: {command}")
+            error_logger.error(JSON_PARSE_ERROR_FORMAT % (error_msg, command))
         raise JSONParseError(error_msg, command) from e
 
 
@@ -47,6 +47,10 @@ MIN_WAIT_TIME = 60                  # Minimum wait time in seconds
 SIGNAL_WAIT_SLEEP_INTERVAL = 0.1    # Sleep interval when waiting for signals
 SIGNAL_WAIT_TIMEOUT = 30.0          # Timeout for signal waiting
 
+# Usage limit reset waiting (sleep in bounded, jittered chunks instead of one long sleep)
+USAGE_LIMIT_WAIT_CHUNK_SECONDS = 30.0   # Base length of each wait chunk
+USAGE_LIMIT_WAIT_JITTER_SECONDS = 15.0  # Random extra per chunk and after the reset time
+
 
 # =============================================================================
 # STATUS VALUES
@@ -6,10 +6,12 @@ the health and activity of long-running operations in the automated
 development workflow.
 
 Key Features:
-    - Thread-safe operation tracking with lock protection
+    - Thread-safe operation tracking; only registration takes a lock
+    - Structure-of-arrays storage with lock-free heartbeat updates and reads
     - Structured data types for operation information
     - Comprehensive error handling and validation
     - Real-time heartbeat monitoring with configurable timeouts
+    - Monotonic nanosecond clock for interval arithmetic (immune to wall-clock jumps)
     - Operation lifecycle management and stale detection
 
 Example Usage:
@@ -24,9 +26,18 @@ Example Usage:
 
 import time
 import threading
+from array import array
 from datetime import datetime, timezone
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+
+# Conversion factor for time.monotonic_ns() values
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+# Largest timeout storable in an array('q') slot (about 292 years); longer
+# timeouts, including float('inf'), are clamped to it
+MAX_TIMEOUT_NS = 2**63 - 1
 
 
 class HeartbeatError(Exception):
@@ -44,11 +55,14 @@ class InvalidTimeoutError(HeartbeatError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class OperationInfo:
     """
     Structured information about a tracked operation.
     
+    Immutable point-in-time snapshot of a tracker slot; the tracker itself
+    stores operation data in parallel arrays.
+    
     Attributes:
         started_at: Unix timestamp when operation tracking began
         last_heartbeat: Unix timestamp of most recent heartbeat
@@ -76,8 +90,25 @@ class HeartbeatTracker:
     stale processes that haven't sent heartbeats within their timeout period.
     
     Thread Safety:
-        All operations are protected by an internal threading lock to ensure
-        safe concurrent access from multiple threads.
+        Only start_heartbeat takes the internal lock, so concurrent
+        registrations cannot claim the same slot. Heartbeat updates are a
+        single array slot store and all reads are lock-free: under the CPython
+        GIL each slot store, slice and dict lookup is atomic, and a new
+        operation's columns are appended before its ID is published in the ID
+        list and index. A reader racing a heartbeat update or restart may see
+        the values from just before it, which is fine for liveness checks.
+    
+    Storage Layout:
+        Operation data is kept as a structure of arrays: parallel ``array('q')``
+        columns for start time, last heartbeat and timeout, a list of operation
+        IDs, and a dict mapping each ID to its slot index. Sweeps copy the
+        columns (a C-level slice) and evaluate timeouts over the copies.
+    
+    Clock:
+        Times are stored as time.monotonic_ns() integers so NTP or DST
+        adjustments cannot make live operations look stale, and sweeps take
+        one clock sample and compare with integer arithmetic. Timestamps in
+        returned dictionaries are converted to Unix time at call time.
     
     Error Handling:
         Methods validate inputs and raise domain-specific exceptions for
@@ -95,9 +126,13 @@ class HeartbeatTracker:
         """
         Initialize the heartbeat tracker with empty operation storage.
         
-        Creates a thread-safe tracker with an internal lock for concurrent access protection.
+        Creates a thread-safe tracker with an internal lock serializing operation registration.
         """
-        self._operations: Dict[str, OperationInfo] = {}
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._started_ns = array('q')
+        self._last_ns = array('q')
+        self._timeout_ns = array('q')
         self._lock = threading.Lock()
     
     def _validate_operation_id(self, operation_id: str) -> None:
@@ -110,10 +145,16 @@ class HeartbeatTracker:
         Raises:
             TypeError: If operation_id is not a string
             ValueError: If operation_id is empty or None
+        
+        Note:
+            Runs on every public call, so plain str IDs take an exact type
+            check (isinstance() still accepts subclasses) and whitespace is
+            checked with str.isspace() rather than strip(), which would
+            allocate a new string per call.
         """
-        if not isinstance(operation_id, str):
+        if type(operation_id) is not str and not isinstance(operation_id, str):
             raise TypeError(f"operation_id must be a string, got {type(operation_id).__name__}")
-        if not operation_id or not operation_id.strip():
+        if not operation_id or operation_id.isspace():
             raise ValueError("operation_id cannot be empty or whitespace")
 
     def _validate_timeout(self, timeout_seconds: Union[int, float]) -> None:
@@ -125,11 +166,11 @@ class HeartbeatTracker:
             
         Raises:
             TypeError: If timeout_seconds is not a number
-            InvalidTimeoutError: If timeout_seconds is not positive
+            InvalidTimeoutError: If timeout_seconds is not positive (or is NaN)
         """
         if not isinstance(timeout_seconds, (int, float)):
             raise TypeError(f"timeout_seconds must be a number, got {type(timeout_seconds).__name__}")
-        if timeout_seconds <= 0:
+        if not timeout_seconds > 0:
             raise InvalidTimeoutError(f"timeout_seconds must be positive, got {timeout_seconds}")
 
     def start_heartbeat(self, operation_id: str, timeout_seconds: Union[int, float]) -> bool:
@@ -141,7 +182,9 @@ class HeartbeatTracker:
         
         Args:
             operation_id: Unique identifier for the operation (must be non-empty string)
-            timeout_seconds: Maximum time allowed between heartbeats (must be positive)
+            timeout_seconds: Maximum time allowed between heartbeats (must be
+                            positive; values above MAX_TIMEOUT_NS nanoseconds,
+                            including float('inf'), are clamped to it)
             
         Returns:
             True if tracking started successfully
@@ -158,15 +201,24 @@ class HeartbeatTracker:
         self._validate_operation_id(operation_id)
         self._validate_timeout(timeout_seconds)
         
-        current_time = time.time()
-        operation_info = OperationInfo(
-            started_at=current_time,
-            last_heartbeat=current_time,
-            timeout_seconds=float(timeout_seconds)
-        )
+        scaled_timeout = timeout_seconds * NANOSECONDS_PER_SECOND
+        timeout_ns = round(scaled_timeout) if scaled_timeout < MAX_TIMEOUT_NS else MAX_TIMEOUT_NS
         
         with self._lock:
-            self._operations[operation_id] = operation_info
+            now_ns = time.monotonic_ns()
+            index = self._index.get(operation_id)
+            if index is None:
+                # Fill the slot before publishing the ID so lock-free readers
+                # never see an ID without its column values
+                self._started_ns.append(now_ns)
+                self._last_ns.append(now_ns)
+                self._timeout_ns.append(timeout_ns)
+                self._ids.append(operation_id)
+                self._index[operation_id] = len(self._ids) - 1
+            else:
+                self._started_ns[index] = now_ns
+                self._last_ns[index] = now_ns
+                self._timeout_ns[index] = timeout_ns
         
         return True
     
@@ -195,15 +247,11 @@ class HeartbeatTracker:
         """
         self._validate_operation_id(operation_id)
         
-        with self._lock:
-            if operation_id not in self._operations:
-                return False
-            
-            operation = self._operations[operation_id]
-            current_time = time.time()
-            time_since_heartbeat = current_time - operation.last_heartbeat
-            
-            return time_since_heartbeat <= operation.timeout_seconds
+        index = self._index.get(operation_id)
+        if index is None:
+            return False
+        
+        return time.monotonic_ns() - self._last_ns[index] <= self._timeout_ns[index]
     
     def update_heartbeat(self, operation_id: str) -> bool:
         """
@@ -230,19 +278,20 @@ class HeartbeatTracker:
         """
         self._validate_operation_id(operation_id)
         
-        with self._lock:
-            if operation_id not in self._operations:
-                return False
-            
-            self._operations[operation_id].last_heartbeat = time.time()
-            return True
+        index = self._index.get(operation_id)
+        if index is None:
+            return False
+        
+        self._last_ns[index] = time.monotonic_ns()
+        return True
     
     def get_active_operations(self) -> List[str]:
         """
         Get list of all tracked operation IDs that are still alive.
         
         This method efficiently retrieves all operations that are currently
-        within their timeout period. The check is performed atomically.
+        within their timeout period. The check runs over a lock-free
+        snapshot of the heartbeat columns.
         
         Returns:
             List of operation IDs that are still alive (empty list if none)
@@ -251,16 +300,14 @@ class HeartbeatTracker:
             >>> tracker.get_active_operations()
             ['task_1', 'task_2', 'background_job']
         """
-        active_ops = []
-        current_time = time.time()
+        ids, last_ns, timeouts_ns = self._snapshot()
+        now_ns = time.monotonic_ns()
         
-        with self._lock:
-            for op_id, operation in self._operations.items():
-                time_since_heartbeat = current_time - operation.last_heartbeat
-                if time_since_heartbeat <= operation.timeout_seconds:
-                    active_ops.append(op_id)
-        
-        return active_ops
+        return [
+            op_id
+            for op_id, last_heartbeat_ns, timeout_ns in zip(ids, last_ns, timeouts_ns)
+            if now_ns - last_heartbeat_ns <= timeout_ns
+        ]
     
     def get_operation_info(self, operation_id: str) -> Optional[Dict[str, float]]:
         """
@@ -286,11 +333,22 @@ class HeartbeatTracker:
         """
         self._validate_operation_id(operation_id)
         
-        with self._lock:
-            if operation_id not in self._operations:
-                return None
-            
-            return self._operations[operation_id].to_dict()
+        index = self._index.get(operation_id)
+        if index is None:
+            return None
+        
+        started_ns = self._started_ns[index]
+        last_ns = self._last_ns[index]
+        timeout_ns = self._timeout_ns[index]
+        now_ns = time.monotonic_ns()
+        wall_now = time.time()
+        
+        operation = OperationInfo(
+            started_at=wall_now - (now_ns - started_ns) / NANOSECONDS_PER_SECOND,
+            last_heartbeat=wall_now - (now_ns - last_ns) / NANOSECONDS_PER_SECOND,
+            timeout_seconds=timeout_ns / NANOSECONDS_PER_SECOND
+        )
+        return operation.to_dict()
     
     def get_stale_operations(self) -> Dict[str, Dict[str, float]]:
         """
@@ -311,17 +369,34 @@ class HeartbeatTracker:
             ...     print(f"{op_id} stale for {info['time_since_heartbeat']:.1f}s")
         """
         stale_ops = {}
-        current_time = time.time()
+        ids, last_ns, timeouts_ns = self._snapshot()
+        now_ns = time.monotonic_ns()
+        wall_now = time.time()
         
-        with self._lock:
-            for op_id, operation in self._operations.items():
-                time_since_heartbeat = current_time - operation.last_heartbeat
-                
-                if time_since_heartbeat > operation.timeout_seconds:
-                    stale_ops[op_id] = {
-                        'last_heartbeat': operation.last_heartbeat,
-                        'timeout_seconds': operation.timeout_seconds,
-                        'time_since_heartbeat': time_since_heartbeat
-                    }
-        
-        return stale_ops
\ No newline at end of file
+        for op_id, last_heartbeat_ns, timeout_ns in zip(ids, last_ns, timeouts_ns):
+            elapsed_ns = now_ns - last_heartbeat_ns
+            
+            if elapsed_ns > timeout_ns:
+                time_since_heartbeat = elapsed_ns / NANOSECONDS_PER_SECOND
+                stale_ops[op_id] = {
+                    'last_heartbeat': wall_now - time_since_heartbeat,
+                    'timeout_seconds': timeout_ns / NANOSECONDS_PER_SECOND,
+                    'time_since_heartbeat': time_since_heartbeat
+                }
+        
+        return stale_ops
+    
+    def _snapshot(self) -> Tuple[List[str], array, array]:
+        """
+        Copy the operation ID list and heartbeat/timeout columns without locking.
+        
+        The ID list is copied first; since columns are appended before IDs are
+        published, the column copies are never shorter than the ID copy and
+        zip() drops any slots registered in between.
+        
+        Returns:
+            Tuple of (operation IDs, last heartbeat monotonic ns, timeouts in ns)
+            with matching slot order
+        """
+        ids = self._ids[:]
+        return ids, self._last_ns[:], self._timeout_ns[:]
\ No newline at end of file
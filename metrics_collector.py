@@ -5,8 +5,102 @@ This module provides the MetricsCollector class that tracks operation performanc
 metrics including timing, success/failure rates, and aggregated statistics.
 """
 
-from typing import Dict, List, Any, Optional, Union
+import itertools
+import math
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple, TypeVar, Union
 from threading import Lock
+from types import MappingProxyType
+
+
+# Number of lock stripes; a power of two so a hash can be masked to an index
+STRIPE_COUNT = 16
+_STRIPE_MASK = STRIPE_COUNT - 1
+
+# Optimistic (lock-free) read attempts on a stripe before falling back to its lock
+OPTIMISTIC_READ_ATTEMPTS = 8
+
+# Default number of most recent operation records retained by a collector
+DEFAULT_MAX_RECORDS = 100_000
+
+# Maximum number of distinct operation_type filters whose stats are cached
+STATS_CACHE_MAX_ENTRIES = 64
+
+# Statistics reported when no matching operations have been recorded
+_EMPTY_STATS_TEMPLATE = MappingProxyType({
+    'total_operations': 0,
+    'successful_operations': 0,
+    'failed_operations': 0,
+    'success_rate': 0.0,
+    'average_duration_ms': 0.0,
+    'min_duration_ms': 0.0,
+    'max_duration_ms': 0.0,
+    'operations_by_type': {}
+})
+
+_T = TypeVar('_T')
+
+
+@dataclass
+class _RunningStats:
+    """
+    Running aggregates for a group of operations.
+    
+    Updated as each operation is recorded so statistics never require
+    a scan over the recorded operations.
+    """
+    count: int = 0
+    successes: int = 0
+    total_duration_ms: float = 0.0
+    min_duration_ms: float = math.inf
+    max_duration_ms: float = 0.0
+    
+    def add(self, duration_ms: float, success: bool) -> None:
+        """Fold one operation into the aggregates."""
+        self.count += 1
+        if success:
+            self.successes += 1
+        self.total_duration_ms += duration_ms
+        if duration_ms < self.min_duration_ms:
+            self.min_duration_ms = duration_ms
+        if duration_ms > self.max_duration_ms:
+            self.max_duration_ms = duration_ms
+    
+    def merge(self, other: '_RunningStats') -> None:
+        """Fold another group's aggregates into these."""
+        self.count += other.count
+        self.successes += other.successes
+        self.total_duration_ms += other.total_duration_ms
+        if other.min_duration_ms < self.min_duration_ms:
+            self.min_duration_ms = other.min_duration_ms
+        if other.max_duration_ms > self.max_duration_ms:
+            self.max_duration_ms = other.max_duration_ms
+
+
+@dataclass
+class _Stripe:
+    """
+    Records and aggregates for the operation types hashed to one stripe.
+    
+    Records are parallel columns; row i of each column describes one
+    operation and sequence holds its position in global recording order.
+    Every field is written under lock. version is a seqlock counter: it is
+    odd while a write is in progress and changes with every write, letting
+    readers detect a torn read without taking the lock.
+    """
+    lock: Lock = field(default_factory=Lock)
+    version: int = 0
+    sequence: array = field(default_factory=lambda: array('q'))
+    names: List[str] = field(default_factory=list)
+    types: List[Optional[str]] = field(default_factory=list)
+    durations: array = field(default_factory=lambda: array('d'))
+    successes: array = field(default_factory=lambda: array('b'))
+    extras: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+    totals: _RunningStats = field(default_factory=_RunningStats)
+    by_type: Dict[str, _RunningStats] = field(default_factory=dict)
 
 
 class MetricsCollector:
@@ -18,12 +112,25 @@ class MetricsCollector:
     success/failure rates, and detailed statistics.
     
     Features:
-    - Thread-safe concurrent access using threading.Lock
-    - Structured operation records with metadata support
-    - Comprehensive statistics calculation with helper methods
+    - Thread-safe concurrent access using locks striped by operation type
+    - Compact column (structure-of-arrays) storage of operation records
+      with metadata support
+    - Bounded retention of the most recent max_records operation records
+    - Incrementally maintained aggregates, so statistics queries are O(1)
+      and cover every recorded operation, including evicted ones
     - Input validation for data integrity
     - Support for operation type filtering
     
+    Thread Safety:
+        Records and aggregates are split across STRIPE_COUNT stripes by
+        hash(operation_type), each with its own lock, so recorders of
+        different operation types do not contend. Statistics queries read
+        each stripe optimistically: they sample its version before and after
+        reading and retry on a mismatch, falling back to the stripe lock
+        after OPTIMISTIC_READ_ATTEMPTS tries, so readers never block
+        recorders. Materializing `operations` locks every stripe in index
+        order.
+    
     Example:
         collector = MetricsCollector()
         collector.record_operation(
@@ -35,21 +142,42 @@ class MetricsCollector:
         stats = collector.get_operation_stats()
     """
     
-    def __init__(self) -> None:
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS) -> None:
         """
         Initialize the metrics collector with thread-safe storage.
         
-        Creates an empty list for operation records and initializes
-        a threading lock for concurrent access protection.
+        Creates STRIPE_COUNT empty stripes, each with its own record
+        columns, running aggregates and lock, the shared sequence counter
+        that orders records across stripes, and the statistics cache.
+        
+        Args:
+            max_records: Number of most recent operation records to retain
+                        (default: DEFAULT_MAX_RECORDS). Older records are
+                        evicted; statistics still include them.
+        
+        Raises:
+            ValueError: If max_records is not a positive integer
         """
-        self.operations: List[Dict[str, Any]] = []
-        self._lock = Lock()
+        if type(max_records) is not int or max_records < 1:
+            raise ValueError(f"max_records must be a positive integer, got {max_records!r}")
+        
+        self._max_records = max_records
+        # Evict in batches so each eviction's memmove is amortized over many records
+        self._eviction_batch = max(1, max_records // 16)
+        self._stripes: List[_Stripe] = [_Stripe() for _ in range(STRIPE_COUNT)]
+        self._sequence = itertools.count()
+        
+        # Last computed stats per operation_type filter, keyed by the stripe
+        # versions they were computed from
+        self._stats_cache: Dict[Optional[str], Tuple[Tuple[int, ...], Dict[str, Any]]] = {}
+        self._by_type_cache: Optional[Tuple[Tuple[int, ...], Dict[str, int]]] = None
     
     def record_operation(
         self, 
         operation_name: str, 
         duration_ms: float, 
         success: bool = True, 
+        operation_type: Optional[str] = None,
         **kwargs: Any
     ) -> bool:
         """
@@ -59,30 +187,54 @@ class MetricsCollector:
             operation_name: Name of the operation (must be non-empty string)
             duration_ms: Duration in milliseconds (must be non-negative)
             success: Whether the operation was successful (default: True)
-            **kwargs: Additional metadata (e.g., operation_type)
+            operation_type: Optional type used to group operations in statistics
+            **kwargs: Additional metadata stored with the operation
         
         Returns:
             bool: True if operation was recorded successfully
             
         Raises:
             ValueError: If operation_name is empty or duration_ms is negative
-            TypeError: If operation_name is not a string or duration_ms is not numeric
+            TypeError: If operation_name is not a string, duration_ms is not
+                      numeric or operation_type is neither None nor a string
         """
         # Validate input parameters
-        self._validate_operation_inputs(operation_name, duration_ms)
-        
-        # For backward compatibility, create a dict that looks like the old format
-        # but store it as an OperationRecord internally
-        operation_dict = {
-            'operation_name': operation_name,
-            'duration_ms': float(duration_ms),
-            'success': bool(success),
-            **kwargs
-        }
+        self._validate_operation_inputs(operation_name, duration_ms, operation_type)
         
-        # Thread-safe append - store as dict to maintain test compatibility
-        with self._lock:
-            self.operations.append(operation_dict)
+        # Coerce only when needed; callers almost always pass float and bool
+        duration = duration_ms if type(duration_ms) is float else float(duration_ms)
+        succeeded = success if success is True or success is False else bool(success)
+        stripe = self._stripes[hash(operation_type) & _STRIPE_MASK]
+        
+        # Append to the stripe's record columns (no per-record dict is built;
+        # the kwargs dict is kept only when extra metadata was passed) and fold the
+        # operation into the stripe's running aggregates. The stripe lock keeps
+        # the rows of the parallel columns aligned, which the GIL alone does not
+        with stripe.lock:
+            stripe.version += 1  # odd: write in progress
+            # GIL-atomic; drawn under the stripe lock so each stripe's
+            # sequence column stays sorted
+            sequence = next(self._sequence)
+            stripe.sequence.append(sequence)
+            stripe.names.append(operation_name)
+            stripe.types.append(operation_type)
+            stripe.durations.append(duration)
+            stripe.successes.append(succeeded)
+            stripe.extras.append(kwargs or None)
+            
+            stripe.totals.add(duration, succeeded)
+            if operation_type:
+                type_stats = stripe.by_type.get(operation_type)
+                if type_stats is None:
+                    type_stats = stripe.by_type[operation_type] = _RunningStats()
+                type_stats.add(duration, succeeded)
+            stripe.version += 1
+        
+        # Once every eviction_batch records, trim all stripes to the retention
+        # window, so stripes that stop receiving writes are trimmed too and at
+        # most max_records + eviction_batch - 1 records stay held between sweeps
+        if sequence % self._eviction_batch == 0 and sequence >= self._max_records:
+            self._evict_expired_records(sequence - self._max_records + 1)
         
         return True
     
@@ -90,11 +242,52 @@ class MetricsCollector:
         """
         Get the total number of operations recorded in a thread-safe manner.
         
+        Lock-free: each stripe count is a single attribute read that only
+        ever grows, so no version check is needed.
+        
         Returns:
             int: Total count of recorded operations
         """
-        with self._lock:
-            return len(self.operations)
+        return sum(stripe.totals.count for stripe in self._stripes)
+    
+    @property
+    def operations(self) -> List[Dict[str, Any]]:
+        """
+        Retained operations as a list of dictionaries.
+        
+        At most max_records of the most recently recorded operations are
+        included. Records are stored column-wise; this builds a fresh list of
+        dictionaries ('operation_name', 'duration_ms', 'success', plus
+        'operation_type' when given and any metadata passed to
+        record_operation) on each access.
+        
+        Returns:
+            List[Dict[str, Any]]: Recorded operations in recording order
+        """
+        with self._all_stripes_locked():
+            rows = [
+                row
+                for stripe in self._stripes
+                for row in zip(stripe.sequence, stripe.names, stripe.types,
+                               stripe.durations, stripe.successes, stripe.extras)
+            ]
+        
+        rows.sort(key=lambda row: row[0])
+        # Stripes are trimmed in batches, so clip records held past the window
+        del rows[:-self._max_records]
+        operations = []
+        for _, name, operation_type, duration, succeeded, extra in rows:
+            operation = {
+                'operation_name': name,
+                'duration_ms': duration,
+                'success': bool(succeeded)
+            }
+            if operation_type is not None:
+                operation['operation_type'] = operation_type
+            if extra:
+                operation.update(extra)
+            operations.append(operation)
+        return operations
     
     def get_operations_by_type(self) -> Dict[str, int]:
         """
@@ -103,8 +296,19 @@ class MetricsCollector:
         Returns:
             Dict[str, int]: Mapping of operation types to their occurrence counts
         """
-        with self._lock:
-            return self._calculate_operations_by_type(self.operations)
+        # Reuse the last result while no stripe has changed since it was built
+        versions = self._stats_versions(None)
+        cached = self._by_type_cache
+        if cached is not None and cached[0] == versions:
+            return dict(cached[1])
+        
+        operations_by_type: Dict[str, int] = {}
+        for stripe in self._stripes:
+            operations_by_type.update(self._read_stripe(stripe, self._count_stripe_types))
+        
+        if not any(version & 1 for version in versions):
+            self._by_type_cache = (versions, operations_by_type)
+        return dict(operations_by_type)
     
     def get_operation_stats(self, operation_type: Optional[str] = None) -> Dict[str, Union[int, float, Dict[str, int]]]:
         """
@@ -126,61 +330,206 @@ class MetricsCollector:
             - max_duration_ms: Maximum operation duration
             - operations_by_type: Count of operations by type
         """
-        with self._lock:
-            # Create a snapshot of operations for consistent calculation
-            operations_snapshot = list(self.operations)
+        # Serve repeated queries from the cache while the stripes they cover
+        # are unchanged; any recorded operation bumps its stripe's version
+        cache_key = operation_type or None
+        versions = self._stats_versions(cache_key)
+        cached = self._stats_cache.get(cache_key)
+        if cached is not None and cached[0] == versions:
+            return self._copy_stats(cached[1])
+        
+        stats = self._calculate_operation_stats(cache_key)
+        
+        # Versions were sampled before the read, so a concurrent write only
+        # makes the cached entry miss next time; mid-write samples are skipped
+        if not any(version & 1 for version in versions) and (
+            cache_key in self._stats_cache or len(self._stats_cache) < STATS_CACHE_MAX_ENTRIES
+        ):
+            self._stats_cache[cache_key] = (versions, stats)
+        return self._copy_stats(stats)
+    
+    def _stats_versions(self, operation_type: Optional[str]) -> Tuple[int, ...]:
+        """
+        Sample the versions of the stripes covered by a stats query.
         
-        # Filter operations by type if specified
-        filtered_ops = self._filter_operations_by_type(operations_snapshot, operation_type)
+        Args:
+            operation_type: Operation type filter, or None for all operations
+            
+        Returns:
+            Tuple of stripe versions
+        """
+        if operation_type:
+            return (self._stripes[hash(operation_type) & _STRIPE_MASK].version,)
+        return tuple(stripe.version for stripe in self._stripes)
+    
+    @staticmethod
+    def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Union[int, float, Dict[str, int]]]:
+        """Copy a stats result so callers cannot mutate a cached entry."""
+        return {**stats, 'operations_by_type': dict(stats['operations_by_type'])}
+    
+    def _calculate_operation_stats(self, operation_type: Optional[str]) -> Dict[str, Union[int, float, Dict[str, int]]]:
+        """
+        Calculate statistics from a snapshot of the stripes' running aggregates.
+        
+        Args:
+            operation_type: Operation type filter, or None for all operations
+            
+        Returns:
+            Dict with calculated statistics
+        """
+        if operation_type:
+            # All operations of one type live on a single stripe
+            stripe = self._stripes[hash(operation_type) & _STRIPE_MASK]
+            stats = self._read_stripe(stripe, lambda s: self._copy_type_stats(s, operation_type))
+            if stats is None:
+                return self._get_empty_stats()
+            return self._calculate_comprehensive_stats(stats, {operation_type: stats.count})
+        
+        # Merge a consistent snapshot of each stripe's running aggregates
+        stats = _RunningStats()
+        operations_by_type: Dict[str, int] = {}
+        for stripe in self._stripes:
+            stripe_totals, stripe_types = self._read_stripe(stripe, self._snapshot_stripe)
+            stats.merge(stripe_totals)
+            operations_by_type.update(stripe_types)
         
         # Handle empty operations case
-        if not filtered_ops:
+        if stats.count == 0:
             return self._get_empty_stats()
         
-        return self._calculate_comprehensive_stats(filtered_ops)
+        return self._calculate_comprehensive_stats(stats, operations_by_type)
+    
+    def _read_stripe(self, stripe: _Stripe, read: Callable[[_Stripe], _T]) -> _T:
+        """
+        Read a consistent snapshot of a stripe, optimistically if possible.
+        
+        The read is accepted when the stripe version was even (no write in
+        progress) and unchanged across it. After OPTIMISTIC_READ_ATTEMPTS
+        failed attempts the read is repeated under the stripe lock.
+        
+        Args:
+            stripe: Stripe to read
+            read: Function copying the needed state out of the stripe
+            
+        Returns:
+            The value returned by read
+        """
+        for _ in range(OPTIMISTIC_READ_ATTEMPTS):
+            version = stripe.version
+            if version & 1:
+                continue
+            try:
+                result = read(stripe)
+            except RuntimeError:
+                # A concurrent writer resized by_type during iteration
+                continue
+            if stripe.version == version:
+                return result
+        
+        with stripe.lock:
+            return read(stripe)
+    
+    @staticmethod
+    def _count_stripe_types(stripe: _Stripe) -> Dict[str, int]:
+        """Copy the per-type operation counts of a stripe."""
+        return {operation_type: stats.count for operation_type, stats in stripe.by_type.items()}
+    
+    @staticmethod
+    def _copy_type_stats(stripe: _Stripe, operation_type: str) -> Optional[_RunningStats]:
+        """Copy the running aggregates of one operation type, if recorded."""
+        stats = stripe.by_type.get(operation_type)
+        return replace(stats) if stats is not None else None
+    
+    @classmethod
+    def _snapshot_stripe(cls, stripe: _Stripe) -> Tuple[_RunningStats, Dict[str, int]]:
+        """Copy the overall aggregates and per-type counts of a stripe."""
+        return replace(stripe.totals), cls._count_stripe_types(stripe)
+    
+    def _evict_expired_records(self, oldest_retained: int) -> None:
+        """
+        Trim every stripe to the retention window.
+        
+        Stripes are locked one at a time, never while another lock is held.
+        Eviction leaves the aggregates untouched, so stripe versions (and the
+        stats cache keyed by them) are not affected.
+        
+        Args:
+            oldest_retained: Sequence number of the oldest record to keep
+        """
+        for stripe in self._stripes:
+            with stripe.lock:
+                if stripe.sequence and stripe.sequence[0] < oldest_retained:
+                    self._evict_records(stripe, oldest_retained)
+    
+    @staticmethod
+    def _evict_records(stripe: _Stripe, oldest_retained: int) -> None:
+        """
+        Drop a stripe's records older than the retention window.
+        
+        Must be called with the stripe locked. Running aggregates are left
+        untouched so statistics still cover the evicted records.
+        
+        Args:
+            stripe: Stripe to evict records from
+            oldest_retained: Sequence number of the oldest record to keep
+        """
+        count = bisect_left(stripe.sequence, oldest_retained)
+        for column in (stripe.sequence, stripe.names, stripe.types,
+                       stripe.durations, stripe.successes, stripe.extras):
+            del column[:count]
+    
+    @contextmanager
+    def _all_stripes_locked(self) -> Iterator[None]:
+        """
+        Hold every stripe lock, acquired in index order to avoid deadlock.
+        
+        Yields:
+            None, while all stripes are locked
+        """
+        for stripe in self._stripes:
+            stripe.lock.acquire()
+        try:
+            yield
+        finally:
+            for stripe in reversed(self._stripes):
+                stripe.lock.release()
 
-    def _validate_operation_inputs(self, operation_name: str, duration_ms: float) -> None:
+    def _validate_operation_inputs(
+        self,
+        operation_name: str,
+        duration_ms: float,
+        operation_type: Optional[str] = None
+    ) -> None:
         """
         Validate input parameters for operation recording.
         
         Args:
             operation_name: Name of the operation to validate
             duration_ms: Duration in milliseconds to validate
+            operation_type: Operation type to validate; it is hashed to pick a stripe
             
         Raises:
             TypeError: If types are incorrect
             ValueError: If values are invalid
         """
-        if not isinstance(operation_name, str):
-            raise TypeError(f"operation_name must be a string, got {type(operation_name)}")
+        # Exact type checks cover the common case; isinstance keeps accepting subclasses
+        name_type = type(operation_name)
+        if name_type is not str and not isinstance(operation_name, str):
+            raise TypeError(f"operation_name must be a string, got {name_type}")
         
-        if not operation_name.strip():
+        # isspace() answers the whitespace question without building a stripped copy
+        if not operation_name or operation_name.isspace():
             raise ValueError("operation_name cannot be empty or whitespace")
-            
-        if not isinstance(duration_ms, (int, float)):
-            raise TypeError(f"duration_ms must be numeric, got {type(duration_ms)}")
+        
+        duration_type = type(duration_ms)
+        if duration_type is not float and duration_type is not int and not isinstance(duration_ms, (int, float)):
+            raise TypeError(f"duration_ms must be numeric, got {duration_type}")
             
         if duration_ms < 0:
             raise ValueError(f"duration_ms must be non-negative, got {duration_ms}")
-
-    def _filter_operations_by_type(
-        self, 
-        operations: List[Dict[str, Any]], 
-        operation_type: Optional[str]
-    ) -> List[Dict[str, Any]]:
-        """
-        Filter operations by type if specified.
         
-        Args:
-            operations: List of operation dictionaries to filter
-            operation_type: Type to filter by, or None for no filtering
-            
-        Returns:
-            List of filtered operations
-        """
-        if operation_type:
-            return [op for op in operations if op.get('operation_type') == operation_type]
-        return operations
+        if operation_type is not None and type(operation_type) is not str and not isinstance(operation_type, str):
+            raise TypeError(f"operation_type must be a string or None, got {type(operation_type)}")
 
     def _get_empty_stats(self) -> Dict[str, Union[int, float, Dict[str, int]]]:
         """
@@ -189,66 +538,34 @@ class MetricsCollector:
         Returns:
             Dict with default zero values for all statistics
         """
-        return {
-            'total_operations': 0,
-            'successful_operations': 0,
-            'failed_operations': 0,
-            'success_rate': 0.0,
-            'average_duration_ms': 0.0,
-            'min_duration_ms': 0.0,
-            'max_duration_ms': 0.0,
-            'operations_by_type': {}
-        }
+        # Copy the template; the nested mapping must not be shared between results
+        return {**_EMPTY_STATS_TEMPLATE, 'operations_by_type': {}}
 
     def _calculate_comprehensive_stats(
         self, 
-        filtered_ops: List[Dict[str, Any]]
+        stats: _RunningStats,
+        operations_by_type: Dict[str, int]
     ) -> Dict[str, Union[int, float, Dict[str, int]]]:
         """
-        Calculate comprehensive statistics for a set of operations.
+        Calculate comprehensive statistics from running aggregates.
         
         Args:
-            filtered_ops: List of operations to calculate statistics for
+            stats: Non-empty running aggregates to report
+            operations_by_type: Count of operations by type to include
             
         Returns:
             Dict with calculated statistics
         """
-        total_operations = len(filtered_ops)
-        successful_operations = sum(1 for op in filtered_ops if op['success'])
-        failed_operations = total_operations - successful_operations
-        success_rate = (successful_operations / total_operations) * 100.0
-        
-        durations = [op['duration_ms'] for op in filtered_ops]
-        average_duration_ms = sum(durations) / len(durations)
-        min_duration_ms = min(durations)
-        max_duration_ms = max(durations)
-        
-        operations_by_type = self._calculate_operations_by_type(filtered_ops)
+        total_operations = stats.count
+        successful_operations = stats.successes
         
         return {
             'total_operations': total_operations,
             'successful_operations': successful_operations,
-            'failed_operations': failed_operations,
-            'success_rate': success_rate,
-            'average_duration_ms': average_duration_ms,
-            'min_duration_ms': min_duration_ms,
-            'max_duration_ms': max_duration_ms,
+            'failed_operations': total_operations - successful_operations,
+            'success_rate': (successful_operations / total_operations) * 100.0,
+            'average_duration_ms': stats.total_duration_ms / total_operations,
+            'min_duration_ms': stats.min_duration_ms,
+            'max_duration_ms': stats.max_duration_ms,
             'operations_by_type': operations_by_type
         }
-
-    def _calculate_operations_by_type(self, operations: List[Dict[str, Any]]) -> Dict[str, int]:
-        """
-        Calculate count of operations by type.
-        
-        Args:
-            operations: List of operations to count by type
-            
-        Returns:
-            Dict mapping operation types to their counts
-        """
-        type_counts = {}
-        for operation in operations:
-            operation_type = operation.get('operation_type')
-            if operation_type:
-                type_counts[operation_type] = type_counts.get(operation_type, 0) + 1
-        return type_counts
\ No newline at end of file
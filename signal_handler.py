@@ -2,23 +2,119 @@
 
 This module provides functions for waiting on signal files and cleaning them up.
 Signal files are used to detect command completion in the automated workflow.
+On Linux, waits block on an inotify watch of the signal file's directory so the
+file is noticed as soon as it is created; elsewhere they sleep between checks.
 """
 
+import ctypes
+import functools
 import logging
 import os
 import random
+import select
+import sys
 import time
 from pathlib import Path
-from typing import Union, Optional
+from typing import Optional, Tuple, Union
 
 from config import SIGNAL_WAIT_TIMEOUT, SIGNAL_WAIT_SLEEP_INTERVAL, LOGGERS
 
 
+# inotify event masks (linux/inotify.h) reporting an entry appearing in a directory
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+SIGNAL_FILE_EVENT_MASK = IN_CREATE | IN_MOVED_TO | IN_CLOSE_WRITE
+INOTIFY_READ_SIZE = 4096    # Bytes drained from the inotify descriptor per wake-up
+
+# Number of doubling steps before the backoff interval is held at its maximum
+BACKOFF_EXPONENTIAL_STEPS = 4
+
+
 def _get_logger() -> Optional[logging.Logger]:
     """Get the command executor logger for this module."""
     return LOGGERS.get('command_executor')
 
 
+def _load_inotify() -> Optional[ctypes.CDLL]:
+    """Load the C library for its inotify functions.
+    
+    Returns:
+        The C library handle, or None if not on Linux or inotify is unavailable
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        # Attribute access resolves the symbols, failing early if they are missing
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_LIBC = _load_inotify()
+
+
+def _open_directory_watch(directory: str) -> Optional[int]:
+    """Open an inotify descriptor reporting entries created in a directory.
+    
+    Args:
+        directory: Directory expected to receive the signal file
+        
+    Returns:
+        Non-blocking inotify file descriptor, or None if inotify is unavailable
+        or the directory cannot be watched (callers then sleep between checks)
+    """
+    if _LIBC is None:
+        return None
+    
+    watch_fd = _LIBC.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if watch_fd < 0:
+        return None
+    
+    if _LIBC.inotify_add_watch(watch_fd, os.fsencode(directory), SIGNAL_FILE_EVENT_MASK) < 0:
+        os.close(watch_fd)
+        return None
+    
+    return watch_fd
+
+
+def _wait_for_directory_event(watch_fd: int, timeout: float) -> None:
+    """Block until the watched directory reports an event or the timeout elapses.
+    
+    Pending events are drained so the next wait blocks again; callers re-check
+    the signal file themselves rather than parsing event names.
+    
+    Args:
+        watch_fd: inotify descriptor returned by _open_directory_watch
+        timeout: Maximum seconds to block
+    """
+    readable, _, _ = select.select([watch_fd], [], [], timeout)
+    if readable:
+        try:
+            os.read(watch_fd, INOTIFY_READ_SIZE)
+        except BlockingIOError:
+            pass
+
+
+@functools.lru_cache(maxsize=32)
+def _backoff_table(min_interval: float, max_interval: float) -> Tuple[float, ...]:
+    """Precompute the backoff intervals for one (min_interval, max_interval) pair.
+    
+    Args:
+        min_interval: Initial interval in seconds
+        max_interval: Maximum interval cap in seconds
+        
+    Returns:
+        Interval for each doubling step, followed by the capped interval
+    """
+    doubling = tuple(min(min_interval * (1 << step), max_interval)
+                     for step in range(BACKOFF_EXPONENTIAL_STEPS))
+    return doubling + (max_interval,)
+
+
 def _calculate_next_interval(iteration: int, min_interval: float, max_interval: float, 
                            jitter: bool = False) -> float:
     """Calculate the next polling interval using exponential backoff.
@@ -30,7 +126,8 @@ def _calculate_next_interval(iteration: int, min_interval: float, max_interval:
         iteration: Current iteration number (0-based)
         min_interval: Initial interval in seconds
         max_interval: Maximum interval cap in seconds
-        jitter: Whether to add random jitter (±10%) to prevent thundering herd
+        jitter: Whether to draw the interval at random below the backoff cap
+            ("full jitter") to prevent thundering herd
         
     Returns:
         Next interval duration in seconds
@@ -38,32 +135,25 @@ def _calculate_next_interval(iteration: int, min_interval: float, max_interval:
     Algorithm:
         - First 4 iterations: min_interval * (2 ^ iteration)
         - 5th iteration and beyond: max_interval
-        - Optional jitter adds ±10% randomization
+        - Optional jitter draws uniformly from [min_interval / 2, that value],
+          so waiters stuck at the cap keep decorrelated wake-up times
         
     Example:
         With min_interval=0.1, max_interval=2.0:
-        - Iteration 0: 0.1s
-        - Iteration 1: 0.2s  
-        - Iteration 2: 0.4s
-        - Iteration 3: 0.8s
-        - Iteration 4+: 2.0s
+        
+        Iteration   No jitter   Jitter
+        0           0.1s        0.05s - 0.1s
+        1           0.2s        0.05s - 0.2s
+        2           0.4s        0.05s - 0.4s
+        3           0.8s        0.05s - 0.8s
+        4+          2.0s        0.05s - 2.0s
     """
-    if iteration < 4:
-        # Exponential backoff: double the interval each iteration
-        interval = min_interval * (2 ** iteration)
-    else:
-        # Cap at maximum interval after 4 iterations
-        interval = max_interval
-    
-    # Ensure we don't exceed the maximum interval during exponential phase
-    interval = min(interval, max_interval)
+    # Doubling intervals for the first steps, then max_interval, looked up per pair
+    interval = _backoff_table(min_interval, max_interval)[min(iteration, BACKOFF_EXPONENTIAL_STEPS)]
     
-    # Add jitter if requested (±10% randomization)
+    # Full jitter: a fixed ±10% band would leave waiters at the cap in lockstep
     if jitter:
-        jitter_factor = 1.0 + random.uniform(-0.1, 0.1)
-        interval = interval * jitter_factor
-        # Re-apply max_interval cap after jitter
-        interval = min(interval, max_interval)
+        interval = random.uniform(min_interval * 0.5, interval)
     
     return interval
 
@@ -78,7 +168,10 @@ def wait_for_signal_file(signal_file_path: Union[str, Path], timeout: float = SI
     
     This function implements robust signal file waiting with timeout protection
     and structured logging. It uses exponential backoff to reduce CPU usage
-    and optional jitter to prevent thundering herd issues.
+    and optional jitter to prevent thundering herd issues. On Linux each
+    backoff wait blocks on an inotify watch of the parent directory instead of
+    sleeping, so the wait ends as soon as the file is created; the backoff
+    interval then only bounds how long a missed event can go unnoticed.
     
     Args:
         signal_file_path: Path to the signal file to wait for (str or Path object)
@@ -86,7 +179,7 @@ def wait_for_signal_file(signal_file_path: Union[str, Path], timeout: float = SI
         sleep_interval: Deprecated. Use min_interval and max_interval instead
         min_interval: Initial seconds to sleep between file existence checks
         max_interval: Maximum seconds to sleep between file existence checks
-        jitter: Whether to add random jitter (±10%) to backoff intervals
+        jitter: Whether to randomize backoff intervals below the backoff cap
         debug: Whether to enable debug-level logging
         
     Raises:
@@ -102,6 +195,7 @@ def wait_for_signal_file(signal_file_path: Union[str, Path], timeout: float = SI
         until max_interval is reached. Optional jitter prevents thundering herd.
     """
     logger = _get_logger()
+    path_str = os.fspath(signal_file_path)
     
     # Handle backward compatibility
     if sleep_interval is not None:
@@ -112,53 +206,72 @@ def wait_for_signal_file(signal_file_path: Union[str, Path], timeout: float = SI
         use_exponential_backoff = True
     
     if logger:
-        logger.debug(f"Waiting for signal file: {signal_file_path} (timeout: {timeout}s)")
+        logger.debug("Waiting for signal file: %s (timeout: %ss)", path_str, timeout)
     
-    start_time = time.time()
-    elapsed_time = 0.0
-    iterations = 0
-    
-    while elapsed_time < timeout:
-        if os.path.exists(str(signal_file_path)):
-            if logger:
-                logger.debug(f"Signal file appeared after {elapsed_time:.1f}s")
-            
-            try:
-                os.remove(str(signal_file_path))
-                if logger:
-                    logger.debug("Signal file cleaned up successfully")
-                return
-            except OSError as e:
-                # Log the error but don't fail - the command may have completed successfully
-                if logger:
-                    logger.warning(f"Failed to remove signal file: {e}")
-                return
+    # Arm the watch before the first check so a file created in between is not missed
+    watch_fd = _open_directory_watch(os.path.dirname(path_str) or os.curdir)
+    try:
+        # Monotonic clock: a wall-clock adjustment must not stretch or cut short the timeout
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        now = start_time
+        iterations = 0
         
-        # Calculate interval using exponential backoff
-        if use_exponential_backoff:
-            current_interval = _calculate_next_interval(
-                iterations, min_interval, max_interval, jitter
-            )
+        while True:
+            if os.path.exists(path_str):
+                if logger:
+                    logger.debug("Signal file appeared after %.1fs", now - start_time)
+                    
+                try:
+                    os.remove(path_str)
+                    if logger:
+                        logger.debug("Signal file cleaned up successfully")
+                    return
+                except OSError as e:
+                    # Log the error but don't fail - the command may have completed successfully
+                    if logger:
+                        logger.warning("Failed to remove signal file: %s", e)
+                    return
             
-            # Log backoff progression for observability
-            if logger and debug:
-                if iterations == 0:
-                    logger.debug(f"Starting exponential backoff: min={min_interval}s, max={max_interval}s, jitter={jitter}")
+            # One clock sample per iteration feeds the deadline check and the wait clamp
+            remaining = deadline - now
+            if remaining <= 0:
+                break
+            
+            # Calculate interval using exponential backoff
+            if use_exponential_backoff:
+                current_interval = _calculate_next_interval(
+                    iterations, min_interval, max_interval, jitter
+                )
                 
-                if current_interval == max_interval and iterations >= 4:
-                    logger.debug(f"Backoff reached maximum interval: {current_interval}s (iteration {iterations})")
-                else:
-                    logger.debug(f"Backoff interval: {current_interval:.3f}s (iteration {iterations})")
+                # Log backoff progression for observability
+                if logger and debug:
+                    if iterations == 0:
+                        logger.debug("Starting exponential backoff: min=%ss, max=%ss, jitter=%s",
+                                     min_interval, max_interval, jitter)
+                    
+                    if current_interval == max_interval and iterations >= BACKOFF_EXPONENTIAL_STEPS:
+                        logger.debug("Backoff reached maximum interval: %ss (iteration %d)", current_interval, iterations)
+                    else:
+                        logger.debug("Backoff interval: %.3fs (iteration %d)", current_interval, iterations)
+            
+            # Never wait past the deadline; the final check happens right at it
+            wait_interval = min(current_interval, remaining)
+            if watch_fd is None:
+                time.sleep(wait_interval)
+            else:
+                _wait_for_directory_event(watch_fd, wait_interval)
+            now = time.monotonic()
+            iterations += 1
         
-        time.sleep(current_interval)
-        elapsed_time = time.time() - start_time
-        iterations += 1
-    
-    # Timeout reached - this indicates a potential issue with Claude CLI execution
-    error_msg = f"Signal file {signal_file_path} did not appear within {timeout}s timeout"
-    if logger:
-        logger.error(error_msg)
-    raise TimeoutError(error_msg)
+        # Timeout reached - this indicates a potential issue with Claude CLI execution
+        error_msg = f"Signal file {path_str} did not appear within {timeout}s timeout"
+        if logger:
+            logger.error(error_msg)
+        raise TimeoutError(error_msg)
+    finally:
+        if watch_fd is not None:
+            os.close(watch_fd)
 
 
 def cleanup_signal_file(signal_file_path: Union[str, Path]) -> None:
@@ -176,12 +289,12 @@ def cleanup_signal_file(signal_file_path: Union[str, Path]) -> None:
     """
     logger = _get_logger()
     
+    # Remove directly rather than checking first: one syscall and no race with the file vanishing
     try:
-        if os.path.exists(str(signal_file_path)):
-            os.remove(str(signal_file_path))
-            if logger:
-                logger.debug(f"Successfully cleaned up signal file: {signal_file_path}")
-    except (OSError, FileNotFoundError, PermissionError) as e:
+        Path(signal_file_path).unlink(missing_ok=True)
+        if logger:
+            logger.debug("Successfully cleaned up signal file: %s", signal_file_path)
+    except OSError as e:
         # Continue if file deletion fails - don't break the workflow
         if logger:
-            logger.warning(f"Failed to clean up signal file {signal_file_path}: {e}")
\ No newline at end of file
+            logger.warning("Failed to clean up signal file %s: %s", signal_file_path, e)
\ No newline at end of file
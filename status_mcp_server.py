@@ -5,8 +5,10 @@ This module implements the StatusServer class with report_status tool
 for creating timestamped JSON status files in the .claude/ directory.
 """
 
+import itertools
 import json
 import datetime
+import os
 import psutil
 from pathlib import Path
 from typing import Dict, Any, TypedDict, Optional
@@ -17,10 +19,11 @@ from mcp.server.fastmcp import FastMCP
 SERVER_NAME = "status-server"
 CLAUDE_DIR_NAME = ".claude"
 TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
-ISO_UTC_SUFFIX_FROM = "+00:00"
-ISO_UTC_SUFFIX_TO = "Z"
+ISO_UTC_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 FILE_PREFIX = "status_"
 FILE_EXTENSION = ".json"
+SEQUENCE_SUFFIX_FORMAT = "_{:06d}"  # Orders and disambiguates files written in the same second
+BYTES_PER_MEGABYTE = 1 << 20
 
 
 class StatusResponse(TypedDict):
@@ -41,76 +44,80 @@ class StatusServer:
         self._mcp = FastMCP(SERVER_NAME)
         self._start_time = datetime.datetime.now(datetime.timezone.utc)
         self._last_request_time: Optional[datetime.datetime] = None
+        self._claude_dir: Optional[Path] = None
+        self._file_sequence = itertools.count()
         
-        # Register the report_status tool
-        @self._mcp.tool()
-        def report_status(status: str, details: Dict[str, Any], task_description: str) -> StatusResponse:
-            """
-            Report development status by creating timestamped JSON file.
-            
-            Args:
-                status: Status type (e.g., "validation_passed", "validation_failed")
-                details: Dictionary with status details
-                task_description: Description of the current task
-                
-            Returns:
-                Dictionary with success status and created file path
-            """
-            self._last_request_time = datetime.datetime.now(datetime.timezone.utc)
-            return self._create_status_file(status, details, task_description)
+        # Reuse one handle for this process instead of creating one per health check
+        try:
+            self._process: Optional[psutil.Process] = psutil.Process()
+        except (psutil.Error, OSError):
+            self._process = None
         
-        # Register the health_check tool
-        @self._mcp.tool()
-        def health_check() -> Dict[str, Any]:
-            """
-            Return comprehensive server health status information.
-            
-            This method provides a detailed health assessment including:
-            - Overall health status (healthy/unhealthy) based on system metrics
-            - Server uptime in seconds since initialization
-            - Timestamp of the last request processed (ISO 8601 format)
-            - Current memory usage in megabytes
-            - Server identification name
-            
-            The health status is determined by validating that system metrics
-            can be successfully retrieved and are within expected ranges.
-            
-            Returns:
-                Dictionary containing:
-                - status (str): "healthy" or "unhealthy"
-                - uptime_seconds (float): Server uptime in seconds
-                - last_request_time (str|None): ISO 8601 timestamp or None
-                - memory_usage_mb (float): Memory usage in MB (0.0 if unavailable)
-                - server_name (str): Server identification name
-                
-            Note:
-                Memory usage falls back to 0.0 if psutil operations fail.
-                Health status considers the server healthy if basic metrics
-                can be retrieved successfully.
-            """
-            # Get system metrics using helper methods
-            uptime_seconds = self._get_uptime_seconds()
-            memory_usage_mb = self._get_memory_usage_mb()
-            
-            # Determine actual health status based on metrics
-            health_status = self._determine_health_status(memory_usage_mb, uptime_seconds)
+        # Register the tools as bound methods on this instance's FastMCP server
+        self._mcp.tool()(self.report_status)
+        self._mcp.tool()(self.health_check)
+    
+    def report_status(self, status: str, details: Dict[str, Any], task_description: str) -> StatusResponse:
+        """
+        Report development status by creating timestamped JSON file.
+        
+        Args:
+            status: Status type (e.g., "validation_passed", "validation_failed")
+            details: Dictionary with status details
+            task_description: Description of the current task
             
-            # Format last request time as ISO 8601
-            last_request_iso = None
-            if self._last_request_time:
-                last_request_iso = self._format_iso_timestamp(self._last_request_time)
+        Returns:
+            Dictionary with success status and created file path
+        """
+        self._last_request_time = datetime.datetime.now(datetime.timezone.utc)
+        return self._create_status_file(status, details, task_description)
+    
+    def health_check(self) -> Dict[str, Any]:
+        """
+        Return comprehensive server health status information.
+        
+        This method provides a detailed health assessment including:
+        - Overall health status (healthy/unhealthy) based on system metrics
+        - Server uptime in seconds since initialization
+        - Timestamp of the last request processed (ISO 8601 format)
+        - Current memory usage in megabytes
+        - Server identification name
+        
+        The health status is determined by validating that system metrics
+        can be successfully retrieved and are within expected ranges.
+        
+        Returns:
+            Dictionary containing:
+            - status (str): "healthy" or "unhealthy"
+            - uptime_seconds (float): Server uptime in seconds
+            - last_request_time (str|None): ISO 8601 timestamp or None
+            - memory_usage_mb (float): Memory usage in MB (0.0 if unavailable)
+            - server_name (str): Server identification name
             
-            return {
-                "status": health_status,
-                "uptime_seconds": uptime_seconds,
-                "last_request_time": last_request_iso,
-                "memory_usage_mb": memory_usage_mb,
-                "server_name": SERVER_NAME
-            }
+        Note:
+            Memory usage falls back to 0.0 if psutil operations fail.
+            Health status considers the server healthy if basic metrics
+            can be retrieved successfully.
+        """
+        # Get system metrics using helper methods
+        uptime_seconds = self._get_uptime_seconds()
+        memory_usage_mb = self._get_memory_usage_mb()
+        
+        # Determine actual health status based on metrics
+        health_status = self._determine_health_status(memory_usage_mb, uptime_seconds)
+        
+        # Format last request time as ISO 8601
+        last_request_iso = None
+        if self._last_request_time:
+            last_request_iso = self._format_iso_timestamp(self._last_request_time)
         
-        # Bind the methods to the instance for direct access
-        self.report_status = report_status
-        self.health_check = health_check
+        return {
+            "status": health_status,
+            "uptime_seconds": uptime_seconds,
+            "last_request_time": last_request_iso,
+            "memory_usage_mb": memory_usage_mb,
+            "server_name": SERVER_NAME
+        }
     
     def _create_status_file(self, status: str, details: Dict[str, Any], task_description: str) -> StatusResponse:
         """
@@ -130,12 +137,26 @@ class StatusServer:
         # Ensure .claude directory exists
         claude_dir = self._ensure_claude_directory()
         
-        # Generate file path with timestamp
-        file_path = self._generate_status_file_path(claude_dir, timestamp)
-        
-        # Create and write status data with same timestamp
+        # Create status data with same timestamp
         status_data = self._create_status_data(status, details, task_description, timestamp)
-        self._write_json_file(file_path, status_data)
+        directory_recreated = False
+        
+        while True:
+            # Generate file path with timestamp
+            file_path = self._generate_status_file_path(claude_dir, timestamp)
+            try:
+                self._write_json_file(file_path, status_data)
+                break
+            except FileExistsError:
+                # Left by an earlier server run in the same second; take the next sequence number
+                continue
+            except FileNotFoundError:
+                # The directory was removed after it was cached; recreate it and retry once
+                if directory_recreated:
+                    raise
+                self._claude_dir = None
+                claude_dir = self._ensure_claude_directory()
+                directory_recreated = True
         
         return {
             "success": True,
@@ -146,17 +167,28 @@ class StatusServer:
         """
         Ensure .claude directory exists and return Path object.
         
+        The directory is created on the first call and cached afterwards;
+        _create_status_file clears the cache if a write finds it missing.
+        
         Returns:
             Path object for .claude directory
         """
+        if self._claude_dir is not None:
+            return self._claude_dir
+        
         claude_dir = Path(CLAUDE_DIR_NAME)
         claude_dir.mkdir(exist_ok=True)
+        self._claude_dir = claude_dir
         return claude_dir
     
     def _generate_status_file_path(self, claude_dir: Path, timestamp: datetime.datetime) -> Path:
         """
         Generate timestamped status file path.
         
+        The timestamp has one-second resolution, so a per-server sequence
+        number follows it; reports made within the same second get distinct
+        files that still sort in the order they were written.
+        
         Args:
             claude_dir: Path to .claude directory
             timestamp: Timestamp to use for filename
@@ -164,21 +196,27 @@ class StatusServer:
         Returns:
             Path object for status file
         """
-        timestamp_str = timestamp.strftime(TIMESTAMP_FORMAT)
-        filename = f"{FILE_PREFIX}{timestamp_str}{FILE_EXTENSION}"
-        return claude_dir / filename
+        # next() on itertools.count is atomic under the GIL
+        sequence = SEQUENCE_SUFFIX_FORMAT.format(next(self._file_sequence))
+        # datetime.__format__ applies TIMESTAMP_FORMAT inside the f-string
+        return claude_dir / f"{FILE_PREFIX}{timestamp:{TIMESTAMP_FORMAT}}{sequence}{FILE_EXTENSION}"
     
     def _format_iso_timestamp(self, timestamp: datetime.datetime) -> str:
         """
         Format datetime object as ISO 8601 string with Z suffix.
         
         Args:
-            timestamp: Datetime object to format
+            timestamp: Timezone-aware datetime object to format; converted to UTC
             
         Returns:
-            ISO 8601 formatted string with Z suffix
+            ISO 8601 formatted string with microseconds and Z suffix
+            
+        Raises:
+            ValueError: If timestamp is naive
         """
-        return timestamp.isoformat().replace(ISO_UTC_SUFFIX_FROM, ISO_UTC_SUFFIX_TO)
+        if timestamp.tzinfo is None:
+            raise ValueError("Status timestamps must be timezone-aware")
+        return timestamp.astimezone(datetime.timezone.utc).strftime(ISO_UTC_TIMESTAMP_FORMAT)
     
     def _get_uptime_seconds(self) -> float:
         """
@@ -197,10 +235,11 @@ class StatusServer:
         Returns:
             Memory usage in MB, or 0.0 if unable to determine
         """
+        if self._process is None:
+            return 0.0
+        
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            return memory_info.rss / (1024 * 1024)  # Convert bytes to MB
+            return self._process.memory_info().rss / BYTES_PER_MEGABYTE
         except (psutil.Error, OSError):
             # Fallback to 0 if psutil fails
             return 0.0
@@ -246,11 +285,38 @@ class StatusServer:
     
     def _write_json_file(self, file_path: Path, data: Dict[str, Any]) -> None:
         """
-        Write data to JSON file with UTF-8 encoding.
+        Write data to a new JSON file with UTF-8 encoding.
+        
+        The write stays synchronous: the orchestrator reads the newest status
+        file as soon as the session ends, so the file must exist before
+        report_status returns. Serializing up front lets it land in a single
+        write call instead of one per JSON token. The file is created with
+        O_EXCL so an existing status file is never overwritten.
         
         Args:
             file_path: Path where to write the file
             data: Data to serialize as JSON
+            
+        Raises:
+            FileExistsError: If a file already exists at file_path
+        """
+        content = memoryview(self._serialize_json(data))
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            # A regular-file write normally completes at once; loop in case it is short
+            while content:
+                content = content[os.write(fd, content):]
+        finally:
+            os.close(fd)
+    
+    def _serialize_json(self, data: Dict[str, Any]) -> bytes:
+        """
+        Serialize data as UTF-8 encoded, 2-space indented JSON.
+        
+        Args:
+            data: Data to serialize as JSON
+            
+        Returns:
+            Encoded JSON document
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
\ No newline at end of file
@@ -25,7 +25,9 @@ from config import (
 
 # Constants for task parsing
 INCOMPLETE_TASK_MARKER = "- [ ]"
-COMPLETED_TASK_MARKER = "- [X]"
+# Encoded marker so the cached file bytes can be searched without decoding
+INCOMPLETE_TASK_MARKER_BYTES = INCOMPLETE_TASK_MARKER.encode('utf-8')
+INCOMPLETE_TASK_MARKER_LENGTH = len(INCOMPLETE_TASK_MARKER_BYTES)
 
 
 def check_file_exists(filepath: str) -> bool:
@@ -48,15 +50,21 @@ class TaskTracker:
     
     Attributes:
         fix_attempts: Dictionary tracking failure count per task identifier
-        _cached_content: Cached file content to minimize I/O operations
-        _cached_mtime: Cached file modification time for cache invalidation
+        _cached_content: Cached raw file bytes to minimize I/O operations
+        _cached_key: Cached (st_mtime_ns, st_size) of the file for cache invalidation
+        _cached_next_task: Parsed (task, line number) for the cached content
         _cache_hits: Number of cache hits for observability
         _cache_misses: Number of cache misses for observability
     """
     
+    # Fixed attribute set: no per-instance __dict__, slot descriptors for access
+    __slots__ = ('fix_attempts', '_cached_content', '_cached_key', '_cached_next_task',
+                 '_cache_hits', '_cache_misses')
+    
     fix_attempts: Dict[str, int]
-    _cached_content: Optional[str]
-    _cached_mtime: Optional[float]
+    _cached_content: Optional[bytes]
+    _cached_key: Optional[Tuple[int, int]]
+    _cached_next_task: Optional[Tuple[Optional[str], int]]
     _cache_hits: int
     _cache_misses: int
     
@@ -67,51 +75,54 @@ class TaskTracker:
         during execution. Each task can have up to MAX_FIX_ATTEMPTS retries.
         """
         self.fix_attempts: Dict[str, int] = {}
-        self._cached_content: Optional[str] = None
-        self._cached_mtime: Optional[float] = None
+        self._cached_content: Optional[bytes] = None
+        self._cached_key: Optional[Tuple[int, int]] = None
+        self._cached_next_task: Optional[Tuple[Optional[str], int]] = None
         self._cache_hits: int = 0
         self._cache_misses: int = 0
     
-    def _load_file_content(self) -> str:
+    def _load_file_content(self, cache_key: Tuple[int, int]) -> bytes:
         """Load Implementation_Plan file content with caching.
         
         This method handles file caching to minimize I/O operations. The cache
-        is invalidated when the file modification time changes.
+        is invalidated when the file modification time or size changes, so an
+        edit within the filesystem's timestamp granularity is still noticed
+        when it changes the length. Content is kept as raw bytes; callers decode
+        only the parts they need.
+        
+        Args:
+            cache_key: The file's (st_mtime_ns, st_size) from the caller's stat call
         
         Returns:
-            The file content as a string
+            The file content as bytes
             
         Raises:
             FileNotFoundError: If the file does not exist
             PermissionError: If permission is denied
-            UnicodeDecodeError: If file has encoding issues
             IOError, OSError: For other file-related errors
         """
         logger = LOGGERS['task_tracker']
         
-        # Get current file modification time
-        current_mtime = os.path.getmtime(IMPLEMENTATION_PLAN_FILE)
-        
         # Check if we need to read the file (cache miss or invalidation)
-        if self._cached_content is None or self._cached_mtime != current_mtime:
+        if self._cached_content is None or self._cached_key != cache_key:
             # Cache miss or invalidation - read file content
-            with open(IMPLEMENTATION_PLAN_FILE, 'r', encoding='utf-8') as f:
+            with open(IMPLEMENTATION_PLAN_FILE, 'rb') as f:
                 content = f.read()
             
             # Update cache
             self._cached_content = content
-            self._cached_mtime = current_mtime
+            self._cached_key = cache_key
+            self._cached_next_task = None
             self._cache_misses += 1
             
-            logger.debug(f"Cache miss: File content loaded and cached with mtime {current_mtime} "
-                        f"(total misses: {self._cache_misses})")
+            logger.debug("Cache miss: File content loaded and cached with (mtime_ns, size) %s "
+                         "(total misses: %d)", cache_key, self._cache_misses)
         else:
             # Cache hit - use cached content
             content = self._cached_content
             self._cache_hits += 1
             
-            logger.debug(f"Cache hit: Using cached file content "
-                        f"(total hits: {self._cache_hits})")
+            logger.debug("Cache hit: Using cached file content (total hits: %d)", self._cache_hits)
         
         return content
     
@@ -138,7 +149,37 @@ class TaskTracker:
         logger.debug("Manually clearing file content cache")
         
         self._cached_content = None
-        self._cached_mtime = None
+        self._cached_key = None
+        self._cached_next_task = None
+    
+    @staticmethod
+    def _find_next_task(content: bytes) -> Tuple[Optional[str], int]:
+        """Locate the first incomplete task in raw Implementation_Plan bytes.
+        
+        Args:
+            content: Raw file content to search
+            
+        Returns:
+            Tuple of (task, line_number) where task is None if every task is
+            complete, and line_number is the 1-based line of the task (0 if none)
+            
+        Raises:
+            UnicodeDecodeError: If the task description is not valid UTF-8
+        """
+        # Find the first incomplete task marker with a single C-level scan
+        marker_index = content.find(INCOMPLETE_TASK_MARKER_BYTES)
+        if marker_index == -1:
+            return (None, 0)
+        
+        # Extract the task description between the marker and the end of its line
+        line_end = content.find(b"\n", marker_index)
+        if line_end == -1:
+            line_end = len(content)
+        task_start = marker_index + INCOMPLETE_TASK_MARKER_LENGTH
+        task = content[task_start:line_end].decode('utf-8').strip()
+        
+        line_number = content.count(b"\n", 0, marker_index) + 1
+        return (task, line_number)
     
     def get_next_task(self) -> Tuple[Optional[str], bool]:
         """Get the next incomplete task from Implementation_Plan.md.
@@ -147,8 +188,9 @@ class TaskTracker:
         as incomplete (with '- [ ]' marker). This implements sequential task
         processing where tasks must be completed in order.
         
-        Uses file caching to minimize I/O operations. The cache is invalidated
-        when the file modification time changes.
+        Uses file caching to minimize I/O operations. The file is scanned once
+        per cached version; the cache is invalidated when the file modification
+        time or size changes.
         
         Returns:
             Tuple of (task_line, all_complete) where:
@@ -161,43 +203,42 @@ class TaskTracker:
         """
         logger = LOGGERS['task_tracker']
         
-        # Check if Implementation_Plan.md exists
-        if not check_file_exists(IMPLEMENTATION_PLAN_FILE):
-            logger.warning(f"Implementation Plan file not found: {IMPLEMENTATION_PLAN_FILE}")
+        # One stat call both checks that Implementation_Plan.md exists and
+        # provides the modification time and size used for cache invalidation
+        try:
+            plan_stat = os.stat(IMPLEMENTATION_PLAN_FILE)
+        except OSError:
+            logger.warning("Implementation Plan file not found: %s", IMPLEMENTATION_PLAN_FILE)
             return (None, True)
         
         try:
             # Load file content using cached helper method
-            content = self._load_file_content()
+            content = self._load_file_content((plan_stat.st_mtime_ns, plan_stat.st_size))
             
-            # Parse file content
-            lines = content.splitlines()
-            logger.debug(f"Processing {len(lines)} lines from file content")
+            # Scan only when the content changed since the last parse
+            if self._cached_next_task is None:
+                self._cached_next_task = self._find_next_task(content)
+            task, line_number = self._cached_next_task
             
-            # Look for first incomplete task using marker constant
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if INCOMPLETE_TASK_MARKER in line:
-                    # Extract the task description after the marker
-                    task = line.split(INCOMPLETE_TASK_MARKER, 1)[1].strip()
-                    logger.info(f"Found next incomplete task on line {i+1}: {task}")
-                    return (task, False)
+            if task is None:
+                # No incomplete tasks found - all are complete
+                logger.info("All tasks in Implementation Plan are complete")
+                return (None, True)
             
-            # No incomplete tasks found - all are complete
-            logger.info("All tasks in Implementation Plan are complete")
-            return (None, True)
+            logger.info("Found next incomplete task on line %d: %s", line_number, task)
+            return (task, False)
             
         except FileNotFoundError as e:
-            logger.error(f"Implementation Plan file not found during read: {e}")
+            logger.error("Implementation Plan file not found during read: %s", e)
             return (None, True)
         except PermissionError as e:
-            logger.error(f"Permission denied reading Implementation Plan file: {e}")
+            logger.error("Permission denied reading Implementation Plan file: %s", e)
             return (None, True)
         except UnicodeDecodeError as e:
-            logger.error(f"Encoding error reading Implementation Plan file: {e}")
+            logger.error("Encoding error reading Implementation Plan file: %s", e)
             return (None, True)
         except (IOError, OSError) as e:
-            logger.error(f"I/O error reading Implementation Plan file: {e}")
+            logger.error("I/O error reading Implementation Plan file: %s", e)
             return (None, True)
     
     def increment_fix_attempts(self, task: str) -> bool:
@@ -221,20 +262,18 @@ class TaskTracker:
             raise ValueError("Task identifier must be a non-empty string")
         
         logger = LOGGERS['task_tracker']
+        max_attempts = MAX_FIX_ATTEMPTS
         
-        # Initialize or increment the count for this task
-        if task not in self.fix_attempts:
-            self.fix_attempts[task] = 0
-        
-        self.fix_attempts[task] += 1
-        current_attempts = self.fix_attempts[task]
+        # Initialize or increment the count for this task in one lookup and one store
+        current_attempts = self.fix_attempts.get(task, 0) + 1
+        self.fix_attempts[task] = current_attempts
         
-        logger.info(f"Incremented fix attempts for task '{task}': {current_attempts}/{MAX_FIX_ATTEMPTS}")
+        logger.info("Incremented fix attempts for task '%s': %d/%d", task, current_attempts, max_attempts)
         
         # Return True if still within limit, False if at or over limit
-        within_limit = current_attempts <= MAX_FIX_ATTEMPTS
+        within_limit = current_attempts <= max_attempts
         if not within_limit:
-            logger.warning(f"Task '{task}' has exceeded max fix attempts ({MAX_FIX_ATTEMPTS})")
+            logger.warning("Task '%s' has exceeded max fix attempts (%d)", task, max_attempts)
         
         return within_limit
     
@@ -260,9 +299,8 @@ class TaskTracker:
         logger = LOGGERS['task_tracker']
         
         # Remove the task from the dictionary if it exists
-        if task in self.fix_attempts:
-            attempts = self.fix_attempts[task]
-            del self.fix_attempts[task]
-            logger.info(f"Reset fix attempts for task '{task}' (had {attempts} attempts)")
+        attempts = self.fix_attempts.pop(task, None)
+        if attempts is not None:
+            logger.info("Reset fix attempts for task '%s' (had %d attempts)", task, attempts)
         else:
-            logger.debug(f"No fix attempts to reset for task '{task}'")
\ No newline at end of file
+            logger.debug("No fix attempts to reset for task '%s'", task)
\ No newline at end of file
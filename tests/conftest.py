@@ -2,9 +2,19 @@
 Pytest configuration file for sharing fixtures across test modules.
 
 This file is automatically discovered by pytest and makes fixtures
-available to all tests in the tests/ directory.
+available to all tests in the tests/ directory. It also puts the project root
+on sys.path once per session so test modules can import the top-level modules
+(automate_dev, task_tracker, ...) without adjusting the import path themselves.
 """
 
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
 # Import all fixtures from test_fixtures to make them available globally
 from test_fixtures import (
     mock_claude_command,
@@ -92,8 +92,8 @@ class TestErrorHandlingConsistency:
                     # Configure subprocess to return invalid JSON
                     mock_result = MagicMock()
                     mock_result.returncode = 0
-                    mock_result.stdout = "invalid json content {"
-                    mock_result.stderr = ""
+                    mock_result.stdout = b"invalid json content {"
+                    mock_result.stderr = b""
                     mock_subprocess_run.return_value = mock_result
                     
                     # Mock the logger to capture error logs  
@@ -133,12 +133,12 @@ class TestErrorHandlingConsistency:
         # Test Scenario 3: Signal file timeout should raise CommandTimeoutError
         with patch('command_executor.subprocess.run') as mock_subprocess_run:
             with patch('os.path.exists', return_value=False):  # Signal file never appears
-                with patch('time.time', side_effect=[0, 1000, 2000, 3000]):  # Simulate time progression past timeout
+                with patch('time.monotonic', side_effect=[0, 1000, 2000, 3000]):  # Simulate time progression past timeout
                     # Configure subprocess to return valid result but signal file times out
                     mock_result = MagicMock()
                     mock_result.returncode = 0
-                    mock_result.stdout = '{"status": "success"}'
-                    mock_result.stderr = ""
+                    mock_result.stdout = b'{"status": "success"}'
+                    mock_result.stderr = b""
                     mock_subprocess_run.return_value = mock_result
                     
                     # Mock the logger to capture error logs
@@ -303,8 +303,8 @@ class TestErrorHandlingConsistency:
                     # Mock subprocess to return invalid JSON
                     mock_result = MagicMock()
                     mock_result.returncode = 0
-                    mock_result.stdout = "invalid json"
-                    mock_result.stderr = ""
+                    mock_result.stdout = b"invalid json"
+                    mock_result.stderr = b""
                     mock_subprocess_run.return_value = mock_result
                     
                     with patch('command_executor.LOGGERS') as mock_loggers:
@@ -336,4 +336,32 @@ class TestErrorHandlingConsistency:
         
         print("Error handler logger consistency test completed.")
         print("This test validates that all error paths use the error_handler logger with consistent formatting.")
-        print("When implemented, error messages should follow: '[ERROR_TYPE]: {message} - Command: {command}'")
\ No newline at end of file
+        print("When implemented, error messages should follow: '[ERROR_TYPE]: {message} - Command: {command}'")
+
+
+class TestErrorMessageFormatting:
+    """Test suite for the per-type error message templates in command_executor."""
+    
+    @pytest.mark.parametrize("exception_name,error_type", [
+        ("CommandExecutionError", "COMMAND_EXECUTION"),
+        ("JSONParseError", "JSON_PARSE"),
+        ("CommandTimeoutError", "COMMAND_TIMEOUT"),
+    ])
+    def test_exception_messages_follow_consistent_format(self, exception_name, error_type):
+        """
+        Test that each exception type formats its message with and without command context.
+        
+        Messages must follow '[ERROR_TYPE]: {message} - Command: {command}', dropping
+        the command suffix when no command is given, and must not interpret '%' in
+        the message or command as format directives.
+        """
+        import command_executor
+        exception_class = getattr(command_executor, exception_name)
+        
+        assert str(exception_class("Operation failed", "/continue")) == (
+            f"[{error_type}]: Operation failed - Command: /continue"
+        )
+        assert str(exception_class("Operation failed")) == f"[{error_type}]: Operation failed"
+        assert str(exception_class("100% done", "/run %s")) == (
+            f"[{error_type}]: 100% done - Command: /run %s"
+        )
@@ -7,16 +7,12 @@ to avoid repeated file I/O operations during frequent get_next_task() calls.
 Phase 13, Task 13.1: Optimize file I/O operations by implementing caching for frequently read files.
 """
 
-import sys
 import os
 import time
 import logging
 from unittest.mock import patch, mock_open, Mock
 from pathlib import Path
 
-# Add parent directory to path so we can import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 from task_tracker import TaskTracker
 from config import IMPLEMENTATION_PLAN_FILE, LOGGERS
@@ -158,4 +154,69 @@ class TestFileIOOptimization:
             f"Expected {expected_total_reads} reads (initial + after modification), "
             f"but got {actual_total_reads} reads. "
             f"This indicates caching is not implemented yet."
-        )
\ No newline at end of file
+        )
+    
+    def test_next_task_extracted_from_raw_bytes(self, tmp_path, monkeypatch):
+        """
+        Test that the first incomplete task is found in the cached raw bytes,
+        including non-ASCII descriptions, CRLF line endings and a final line
+        without a trailing newline.
+        """
+        monkeypatch.chdir(tmp_path)
+        plan_file = tmp_path / IMPLEMENTATION_PLAN_FILE
+        
+        plan_file.write_bytes("# Plan\r\n- [X] Done\r\n- [ ] Añadir caché  \r\n- [ ] Later\r\n".encode('utf-8'))
+        tracker = TaskTracker()
+        assert tracker.get_next_task() == ("Añadir caché", False)
+        assert isinstance(tracker._cached_content, bytes)
+        
+        plan_file.write_bytes(b"- [X] Done\n- [ ] Last task")
+        tracker.clear_cache()
+        assert tracker.get_next_task() == ("Last task", False)
+        
+        plan_file.write_bytes(b"- [X] Done\n- [X] Also done\n")
+        tracker.clear_cache()
+        assert tracker.get_next_task() == (None, True)
+    
+    def test_next_task_parsed_once_per_file_version(self, tmp_path, monkeypatch):
+        """
+        Test that cache hits reuse the parsed next task instead of scanning
+        the cached content again, and that a file change triggers a re-parse.
+        """
+        monkeypatch.chdir(tmp_path)
+        plan_file = tmp_path / IMPLEMENTATION_PLAN_FILE
+        plan_file.write_text("- [X] Done\n- [ ] First\n- [ ] Second\n", encoding='utf-8')
+        
+        tracker = TaskTracker()
+        with patch.object(TaskTracker, '_find_next_task', wraps=TaskTracker._find_next_task) as mock_find:
+            for _ in range(3):
+                assert tracker.get_next_task() == ("First", False)
+            assert mock_find.call_count == 1
+            
+            plan_file.write_text("- [X] Done\n- [X] First\n- [ ] Second\n", encoding='utf-8')
+            forced_mtime = os.path.getmtime(plan_file) + 1
+            os.utime(plan_file, (forced_mtime, forced_mtime))
+            
+            assert tracker.get_next_task() == ("Second", False)
+            assert tracker.get_next_task() == ("Second", False)
+            assert mock_find.call_count == 2
+    
+    def test_cache_invalidated_by_size_change_with_same_mtime(self, tmp_path, monkeypatch):
+        """
+        Test that an edit which keeps the modification time (e.g. within a
+        coarse filesystem timestamp) but changes the file size still
+        invalidates the cache.
+        """
+        monkeypatch.chdir(tmp_path)
+        plan_file = tmp_path / IMPLEMENTATION_PLAN_FILE
+        plan_file.write_text("- [ ] First\n- [ ] Second\n", encoding='utf-8')
+        original_stat = os.stat(plan_file)
+        
+        tracker = TaskTracker()
+        assert tracker.get_next_task() == ("First", False)
+        
+        plan_file.write_text("- [X] First\n- [ ] Second task\n", encoding='utf-8')
+        os.utime(plan_file, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+        
+        assert tracker.get_next_task() == ("Second task", False)
+        assert tracker.get_cache_stats()['cache_misses'] == 2
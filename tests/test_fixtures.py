@@ -21,8 +21,8 @@ def mock_subprocess_success():
     mock = Mock()
     mock.return_value = Mock()
     mock.return_value.returncode = 0
-    mock.return_value.stdout = "Command executed successfully"
-    mock.return_value.stderr = ""
+    mock.return_value.stdout = b"Command executed successfully"
+    mock.return_value.stderr = b""
     return mock
 
 
@@ -7,17 +7,12 @@ graceful shutdown handling with signal handlers for SIGTERM and SIGINT.
 Phase 13, Task 13.5: Add graceful shutdown handling.
 """
 
-import sys
-import os
 import signal
 import time
 import logging
 from unittest.mock import patch, Mock, MagicMock, call
 from pathlib import Path
 
-# Add parent directory to path so we can import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 from automate_dev import main
 from config import LOGGERS
@@ -101,4 +101,155 @@ class TestHeartbeatMechanism:
         assert 'last_heartbeat' in stale_info, "Stale operation info should include last_heartbeat"
         assert 'timeout_seconds' in stale_info, "Stale operation info should include timeout_seconds"
         assert 'time_since_heartbeat' in stale_info, "Stale operation info should include time_since_heartbeat"
-        assert stale_info['time_since_heartbeat'] > timeout_seconds, "time_since_heartbeat should exceed timeout"
\ No newline at end of file
+        assert stale_info['time_since_heartbeat'] > timeout_seconds, "time_since_heartbeat should exceed timeout"
+    
+    def test_heartbeat_tracker_restart_and_multi_operation_sweeps(self):
+        """
+        Test that restarting an operation reuses its slot and that sweeps keep
+        operation IDs aligned with their own heartbeat and timeout values.
+        
+        Given several tracked operations with different timeouts,
+        when one operation is restarted with a new timeout,
+        then it should keep a single entry with the new timeout,
+        and active/stale sweeps should classify each operation independently.
+        """
+        from heartbeat_tracker import HeartbeatTracker
+        
+        tracker = HeartbeatTracker()
+        tracker.start_heartbeat("short_op", 0.05)
+        tracker.start_heartbeat("long_op", 60.0)
+        tracker.start_heartbeat("restarted_op", 0.05)
+        tracker.start_heartbeat("restarted_op", 60.0)
+        
+        assert tracker.get_operation_info("restarted_op")['timeout_seconds'] == 60.0
+        assert sorted(tracker.get_active_operations()) == ["long_op", "restarted_op", "short_op"]
+        
+        time.sleep(0.1)
+        
+        assert sorted(tracker.get_active_operations()) == ["long_op", "restarted_op"]
+        stale_operations = tracker.get_stale_operations()
+        assert list(stale_operations) == ["short_op"]
+        assert stale_operations["short_op"]['timeout_seconds'] == 0.05
+        assert tracker.update_heartbeat("missing_op") is False
+        assert tracker.get_operation_info("missing_op") is None
+    
+    def test_heartbeat_tracker_concurrent_registration_and_updates(self):
+        """
+        Test that concurrent registrations, heartbeat updates and sweeps keep
+        every operation paired with its own timeout.
+        
+        Given several threads registering and updating distinct operations
+        while another thread sweeps active operations,
+        then every operation should be registered exactly once
+        and report the timeout it was registered with.
+        """
+        import threading
+        from heartbeat_tracker import HeartbeatTracker
+        
+        tracker = HeartbeatTracker()
+        thread_count = 8
+        ops_per_thread = 50
+        stop_sweeping = threading.Event()
+        
+        def register_and_update(thread_index):
+            for i in range(ops_per_thread):
+                operation_id = f"op_{thread_index}_{i}"
+                tracker.start_heartbeat(operation_id, 30.0 + thread_index)
+                tracker.update_heartbeat(operation_id)
+        
+        def sweep():
+            while not stop_sweeping.is_set():
+                tracker.get_active_operations()
+                tracker.get_stale_operations()
+        
+        sweeper = threading.Thread(target=sweep)
+        sweeper.start()
+        workers = [threading.Thread(target=register_and_update, args=(t,)) for t in range(thread_count)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        stop_sweeping.set()
+        sweeper.join()
+        
+        active_operations = tracker.get_active_operations()
+        assert len(active_operations) == thread_count * ops_per_thread
+        assert len(set(active_operations)) == len(active_operations)
+        for thread_index in range(thread_count):
+            info = tracker.get_operation_info(f"op_{thread_index}_0")
+            assert info['timeout_seconds'] == 30.0 + thread_index
+    
+    def test_heartbeat_tracker_ignores_wall_clock_jumps(self):
+        """
+        Test that wall-clock adjustments do not affect liveness decisions.
+        
+        Given a freshly started operation,
+        when the wall clock jumps forward by an hour (e.g. an NTP correction),
+        then the operation should still be alive and not reported as stale,
+        because heartbeat intervals are measured on the monotonic clock.
+        """
+        from heartbeat_tracker import HeartbeatTracker
+        
+        tracker = HeartbeatTracker()
+        tracker.start_heartbeat("steady_op", 5.0)
+        
+        jumped_wall_time = time.time() + 3600
+        with patch('heartbeat_tracker.time.time', return_value=jumped_wall_time):
+            assert tracker.is_operation_alive("steady_op") is True
+            assert tracker.get_active_operations() == ["steady_op"]
+            assert tracker.get_stale_operations() == {}
+            info = tracker.get_operation_info("steady_op")
+        
+        assert info['timeout_seconds'] == 5.0
+        assert info['started_at'] <= info['last_heartbeat'] <= jumped_wall_time
+    
+    def test_heartbeat_tracker_clamps_unbounded_timeouts(self):
+        """
+        Test that infinite and very large timeouts are accepted and clamped to
+        the largest storable timeout, and that NaN timeouts are rejected.
+        """
+        from heartbeat_tracker import HeartbeatTracker, InvalidTimeoutError, MAX_TIMEOUT_NS
+        
+        tracker = HeartbeatTracker()
+        for operation_id, timeout in (("forever_op", float('inf')), ("huge_op", 1e10)):
+            assert tracker.start_heartbeat(operation_id, timeout) is True
+            assert tracker.is_operation_alive(operation_id) is True
+            assert tracker.get_operation_info(operation_id)['timeout_seconds'] == MAX_TIMEOUT_NS / 1_000_000_000
+        
+        assert sorted(tracker.get_active_operations()) == ["forever_op", "huge_op"]
+        assert tracker.get_stale_operations() == {}
+        
+        with pytest.raises(InvalidTimeoutError):
+            tracker.start_heartbeat("nan_op", float('nan'))
+    
+    def test_heartbeat_tracker_validates_operation_ids(self):
+        """
+        Test that operation IDs are validated on the public API.
+        
+        Non-string IDs should raise TypeError and empty or whitespace-only IDs
+        should raise ValueError, for both registration and updates.
+        """
+        from heartbeat_tracker import HeartbeatTracker
+        
+        tracker = HeartbeatTracker()
+        
+        for invalid_id in (None, 123, b"op"):
+            with pytest.raises(TypeError):
+                tracker.start_heartbeat(invalid_id, 1.0)
+            with pytest.raises(TypeError):
+                tracker.update_heartbeat(invalid_id)
+        
+        for blank_id in ("", "   ", "\t\n"):
+            with pytest.raises(ValueError):
+                tracker.start_heartbeat(blank_id, 1.0)
+            with pytest.raises(ValueError):
+                tracker.is_operation_alive(blank_id)
+        
+        assert tracker.start_heartbeat(" padded ", 1.0) is True
+        assert tracker.update_heartbeat(" padded ") is True
+        
+        class OperationName(str):
+            pass
+        
+        assert tracker.start_heartbeat(OperationName("subclassed"), 1.0) is True
+        assert tracker.update_heartbeat("subclassed") is True
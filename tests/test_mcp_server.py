@@ -87,9 +87,9 @@ class TestMCPStatusServerReportTool:
         
         status_file = claude_files[0]
         
-        # Verify filename format: status_[timestamp].json
+        # Verify filename format: status_[timestamp]_[sequence].json
         expected_timestamp_str = mock_timestamp.strftime("%Y%m%d_%H%M%S")
-        expected_filename = f"status_{expected_timestamp_str}.json"
+        expected_filename = f"status_{expected_timestamp_str}_000000.json"
         assert status_file.name == expected_filename, f"Expected filename '{expected_filename}', got '{status_file.name}'"
         
         # Verify file contents
@@ -348,4 +348,86 @@ class TestMCPStatusServerHealthCheck:
         # Verify server name is included if available
         if "server_name" in result:
             assert isinstance(result["server_name"], str), "server_name should be a string"
-            assert len(result["server_name"]) > 0, "server_name should not be empty"
\ No newline at end of file
+            assert len(result["server_name"]) > 0, "server_name should not be empty"
+    
+    def test_report_status_recreates_claude_directory_removed_after_first_write(self, tmp_path, monkeypatch):
+        """
+        Test that report_status creates the .claude directory once, and still
+        writes the status file if the directory is deleted between calls.
+        """
+        from pathlib import Path
+        from status_mcp_server import StatusServer
+        
+        monkeypatch.chdir(tmp_path)
+        server = StatusServer()
+        
+        with patch.object(Path, 'mkdir', autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            server.report_status(status="validation_passed", details={}, task_description="first")
+            server.report_status(status="validation_passed", details={}, task_description="second")
+            assert mock_mkdir.call_count == 1, "The .claude directory should only be created once"
+            
+            shutil.rmtree(tmp_path / ".claude")
+            result = server.report_status(status="validation_failed", details={}, task_description="third")
+        
+        assert Path(result["file_created"]).exists(), "Status file should be written after recreating .claude"
+        assert mock_mkdir.call_count == 2
+    
+    def test_reports_in_the_same_second_get_distinct_ordered_files(self, tmp_path, monkeypatch):
+        """
+        Test that two reports with the same timestamp do not overwrite each
+        other, and the later report sorts last by filename.
+        """
+        from status_mcp_server import StatusServer
+        
+        monkeypatch.chdir(tmp_path)
+        server = StatusServer()
+        
+        mock_timestamp = datetime(2024, 1, 15, 10, 30, 45, tzinfo=timezone.utc)
+        with patch('status_mcp_server.datetime.datetime') as mock_datetime:
+            mock_datetime.now.return_value = mock_timestamp
+            server.report_status(status="validation_failed", details={}, task_description="first")
+            server.report_status(status="validation_passed", details={}, task_description="second")
+        
+        status_files = sorted((tmp_path / ".claude").glob("status_*.json"), key=lambda p: p.name)
+        assert len(status_files) == 2, "Same-second reports should not overwrite each other"
+        with open(status_files[-1], 'r', encoding='utf-8') as f:
+            assert json.load(f)["status"] == "validation_passed"
+    
+    def test_report_status_never_overwrites_an_existing_status_file(self, tmp_path, monkeypatch):
+        """
+        Test that a status file left by an earlier server run with the same
+        name is kept, and the new report is written under the next sequence number.
+        """
+        from status_mcp_server import StatusServer
+        
+        monkeypatch.chdir(tmp_path)
+        claude_dir = tmp_path / ".claude"
+        claude_dir.mkdir()
+        existing = claude_dir / "status_20240115_103045_000000.json"
+        existing.write_text('{"status": "validation_failed"}', encoding='utf-8')
+        
+        server = StatusServer()
+        mock_timestamp = datetime(2024, 1, 15, 10, 30, 45, tzinfo=timezone.utc)
+        with patch('status_mcp_server.datetime.datetime') as mock_datetime:
+            mock_datetime.now.return_value = mock_timestamp
+            result = server.report_status(status="validation_passed", details={}, task_description="task")
+        
+        assert json.loads(existing.read_text(encoding='utf-8'))["status"] == "validation_failed"
+        assert result["file_created"].endswith("status_20240115_103045_000001.json")
+        with open(result["file_created"], 'r', encoding='utf-8') as f:
+            assert json.load(f)["status"] == "validation_passed"
+    
+    def test_status_timestamps_are_written_in_utc_and_naive_ones_rejected(self):
+        """
+        Test that timezone-aware timestamps are converted to UTC before the Z
+        suffix is added, and naive timestamps raise ValueError.
+        """
+        from datetime import timedelta
+        from status_mcp_server import StatusServer
+        
+        server = StatusServer()
+        eastern = timezone(timedelta(hours=-5))
+        
+        assert server._format_iso_timestamp(datetime(2024, 1, 15, 5, 30, 45, tzinfo=eastern)) == "2024-01-15T10:30:45.000000Z"
+        with pytest.raises(ValueError):
+            server._format_iso_timestamp(datetime(2024, 1, 15, 10, 30, 45))
@@ -162,4 +162,254 @@ class TestMetricsCollector:
         
         # Test that metrics persist across multiple queries
         overall_stats_2 = collector.get_operation_stats()
-        assert overall_stats_2 == overall_stats, "Statistics should be consistent across multiple queries"
\ No newline at end of file
+        assert overall_stats_2 == overall_stats, "Statistics should be consistent across multiple queries"
+    
+    def test_running_aggregates_match_recorded_operations(self):
+        """
+        Test that statistics served from running aggregates match a direct
+        calculation over the recorded operations.
+        
+        Given a mix of typed and untyped operations with varied durations
+        and outcomes, overall and per-type statistics, as well as the
+        per-type counts, should equal values computed from scratch over
+        collector.operations.
+        """
+        import random
+        from metrics_collector import MetricsCollector
+        
+        rng = random.Random(1234)
+        collector = MetricsCollector()
+        types = ["io", "validation", "command", None]
+        
+        for i in range(500):
+            operation_type = rng.choice(types)
+            kwargs = {'operation_type': operation_type} if operation_type else {}
+            collector.record_operation(
+                operation_name=f"op_{i}",
+                duration_ms=rng.choice([rng.uniform(0, 500), rng.randint(0, 500)]),
+                success=rng.random() < 0.7,
+                **kwargs
+            )
+        
+        def expected_stats(operations):
+            durations = [op['duration_ms'] for op in operations]
+            successes = sum(1 for op in operations if op['success'])
+            return {
+                'total_operations': len(operations),
+                'successful_operations': successes,
+                'failed_operations': len(operations) - successes,
+                'success_rate': pytest.approx(successes / len(operations) * 100.0),
+                'average_duration_ms': pytest.approx(sum(durations) / len(durations)),
+                'min_duration_ms': min(durations),
+                'max_duration_ms': max(durations),
+            }
+        
+        operations = collector.operations
+        assert len(operations) == collector.get_total_operations() == 500
+        assert [op['operation_name'] for op in operations] == [f"op_{i}" for i in range(500)]
+        
+        expected_by_type = {}
+        for op in operations:
+            if op.get('operation_type'):
+                expected_by_type[op['operation_type']] = expected_by_type.get(op['operation_type'], 0) + 1
+        assert collector.get_operations_by_type() == expected_by_type
+        
+        overall_stats = collector.get_operation_stats()
+        assert overall_stats == {**expected_stats(operations), 'operations_by_type': expected_by_type}
+        
+        for operation_type in ["io", "validation", "command"]:
+            typed_ops = [op for op in operations if op.get('operation_type') == operation_type]
+            assert collector.get_operation_stats(operation_type=operation_type) == {
+                **expected_stats(typed_ops),
+                'operations_by_type': {operation_type: len(typed_ops)}
+            }
+    
+    def test_concurrent_recording_across_operation_types(self):
+        """
+        Test that concurrent recorders of different operation types lose no
+        operations and keep the per-type aggregates consistent.
+        
+        Given several threads each recording many operations under its own
+        operation type, every operation should be counted exactly once and
+        the overall statistics should equal the sum of the per-type ones.
+        """
+        import threading
+        from metrics_collector import MetricsCollector
+        
+        collector = MetricsCollector()
+        types = [f"type_{i}" for i in range(8)]
+        per_thread = 2000
+        
+        def record(operation_type):
+            for i in range(per_thread):
+                collector.record_operation(
+                    operation_name=f"{operation_type}_{i}",
+                    duration_ms=float(i % 100),
+                    success=i % 4 != 0,
+                    operation_type=operation_type
+                )
+        
+        threads = [threading.Thread(target=record, args=(t,)) for t in types]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        total = per_thread * len(types)
+        assert collector.get_total_operations() == total
+        assert len(collector.operations) == total
+        assert collector.get_operations_by_type() == {t: per_thread for t in types}
+        
+        overall_stats = collector.get_operation_stats()
+        assert overall_stats['total_operations'] == total
+        assert overall_stats['successful_operations'] == sum(
+            collector.get_operation_stats(operation_type=t)['successful_operations'] for t in types
+        )
+        assert overall_stats['min_duration_ms'] == 0.0
+        assert overall_stats['max_duration_ms'] == 99.0
+    
+    def test_stats_reads_stay_consistent_during_concurrent_recording(self):
+        """
+        Test that lock-free statistics reads never observe a torn update.
+        
+        Given recorders writing typed operations while a reader polls the
+        statistics, every snapshot should have overall totals equal to the
+        sum of its per-type counts, and a stripe stuck mid-write should
+        still be readable through the lock fallback.
+        """
+        import threading
+        from metrics_collector import MetricsCollector
+        
+        collector = MetricsCollector()
+        types = [f"type_{i}" for i in range(4)]
+        stop = threading.Event()
+        
+        def record(operation_type):
+            i = 0
+            while not stop.is_set():
+                collector.record_operation(f"op_{i}", float(i % 10), operation_type=operation_type)
+                i += 1
+        
+        threads = [threading.Thread(target=record, args=(t,)) for t in types]
+        for thread in threads:
+            thread.start()
+        try:
+            for _ in range(200):
+                stats = collector.get_operation_stats()
+                assert stats['total_operations'] == sum(stats['operations_by_type'].values())
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        
+        stripe = collector._stripes[hash("type_0") & (len(collector._stripes) - 1)]
+        stripe.version += 1  # simulate a writer that never finishes
+        try:
+            assert collector.get_operation_stats(operation_type="type_0")['total_operations'] > 0
+        finally:
+            stripe.version += 1
+    
+    def test_operation_stats_cache_invalidated_by_recording(self):
+        """
+        Test that repeated stats queries are served from the cache until an
+        operation is recorded, and that callers cannot corrupt cached results.
+        """
+        from metrics_collector import MetricsCollector
+        
+        collector = MetricsCollector()
+        collector.record_operation("read", 10.0, operation_type="io")
+        collector.record_operation("check", 20.0, operation_type="validation")
+        
+        with patch.object(collector, '_calculate_operation_stats',
+                          wraps=collector._calculate_operation_stats) as calculate:
+            first = collector.get_operation_stats()
+            first['operations_by_type']['io'] = 999
+            first['total_operations'] = 999
+            second = collector.get_operation_stats()
+            assert calculate.call_count == 1
+            assert second['total_operations'] == 2
+            assert second['operations_by_type'] == {'io': 1, 'validation': 1}
+            
+            assert collector.get_operation_stats(operation_type="io")['total_operations'] == 1
+            assert calculate.call_count == 2
+            
+            collector.record_operation("write", 30.0, operation_type="io")
+            assert collector.get_operation_stats()['total_operations'] == 3
+            assert collector.get_operation_stats(operation_type="io")['total_operations'] == 2
+            assert calculate.call_count == 4
+    
+    def test_operations_by_type_memoized_until_recording(self):
+        """
+        Test that get_operations_by_type reuses its last result until an
+        operation is recorded, and returns copies callers may mutate.
+        """
+        from metrics_collector import MetricsCollector
+        
+        collector = MetricsCollector()
+        collector.record_operation("read", 10.0, operation_type="io")
+        
+        with patch.object(collector, '_count_stripe_types',
+                          wraps=collector._count_stripe_types) as count_types:
+            first = collector.get_operations_by_type()
+            first['io'] = 999
+            assert collector.get_operations_by_type() == {'io': 1}
+            scans = count_types.call_count
+            
+            collector.record_operation("check", 5.0, operation_type="validation")
+            assert collector.get_operations_by_type() == {'io': 1, 'validation': 1}
+            assert count_types.call_count == 2 * scans
+    
+    def test_operation_type_and_metadata_preserved_in_operations(self):
+        """
+        Test that operation_type and extra metadata are returned with each
+        recorded operation, and omitted when not given.
+        """
+        from metrics_collector import MetricsCollector
+        
+        collector = MetricsCollector()
+        collector.record_operation("read", 5, operation_type="io", path="plan.md")
+        collector.record_operation("tick", 1.5, success=False)
+        
+        assert collector.operations == [
+            {'operation_name': 'read', 'duration_ms': 5.0, 'success': True,
+             'operation_type': 'io', 'path': 'plan.md'},
+            {'operation_name': 'tick', 'duration_ms': 1.5, 'success': False},
+        ]
+        
+        # Unhashable or non-string types are rejected before anything is recorded
+        for invalid_type in (["io"], {"kind": "io"}, 3):
+            with pytest.raises(TypeError, match="operation_type"):
+                collector.record_operation("write", 1.0, operation_type=invalid_type)
+        assert collector.get_total_operations() == 2
+    
+    def test_record_retention_bounded_while_stats_cover_all_operations(self):
+        """
+        Test that only the most recent max_records operations are retained
+        while statistics still cover every recorded operation.
+        """
+        from metrics_collector import MetricsCollector
+        
+        with pytest.raises(ValueError):
+            MetricsCollector(max_records=0)
+        
+        collector = MetricsCollector(max_records=32)
+        types = ["io", "validation", "command", None]
+        for i in range(1000):
+            collector.record_operation(f"op_{i}", float(i), operation_type=types[i % 4])
+        
+        operations = collector.operations
+        assert [op['operation_name'] for op in operations] == [f"op_{i}" for i in range(968, 1000)]
+        # Stripes are trimmed every max_records // 16 records, across all stripes
+        assert sum(len(stripe.names) for stripe in collector._stripes) <= 32 + 2
+        
+        stats = collector.get_operation_stats()
+        assert collector.get_total_operations() == stats['total_operations'] == 1000
+        assert stats['min_duration_ms'] == 0.0
+        assert stats['max_duration_ms'] == 999.0
+        assert collector.get_operations_by_type() == {'io': 250, 'validation': 250, 'command': 250}
+        
+        # Records on a stripe that stops receiving writes still leave the window
+        for i in range(40):
+            collector.record_operation(f"late_{i}", 1.0, operation_type="late")
+            assert sum(len(stripe.names) for stripe in collector._stripes) <= 32 + 2
+        assert [op['operation_name'] for op in collector.operations] == [f"late_{i}" for i in range(8, 40)]
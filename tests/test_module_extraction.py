@@ -10,11 +10,6 @@ These tests will initially fail since the modules don't exist yet,
 following TDD red-green-refactor principles.
 """
 
-import sys
-import os
-# Add parent directory to path so we can import the modules
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 import importlib
 import inspect
@@ -495,9 +495,10 @@ class TestTaskTrackerFailureTracking:
 class TestClaudeCommandExecution:
     """Test suite for Claude CLI command execution functionality."""
     
+    @patch('command_executor.cleanup_signal_file')
     @patch('os.remove')
     @patch('os.path.exists')
-    def test_run_claude_command_waits_for_signal_file_and_cleans_up(self, mock_exists, mock_remove):
+    def test_run_claude_command_waits_for_signal_file_and_cleans_up(self, mock_exists, mock_remove, mock_clear_stale):
         """
         Test that run_claude_command waits for signal_task_complete file and cleans up after.
         
@@ -507,6 +508,9 @@ class TestClaudeCommandExecution:
         2. Wait for ".claude/signal_task_complete" file to exist before returning
         3. Clean up (remove) the signal file after the loop breaks
         
+        A stale signal file is also removed before the command runs, so a
+        leftover signal cannot end the wait early.
+        
         This test will initially fail because the signal file waiting logic doesn't exist yet.
         This is the RED phase of TDD - the test must fail first.
         """
@@ -514,8 +518,8 @@ class TestClaudeCommandExecution:
         with patch('command_executor.subprocess.run') as mock_subprocess_run:
             mock_result = MagicMock()
             mock_result.returncode = 0
-            mock_result.stdout = '{"status": "success", "output": "Command completed"}'
-            mock_result.stderr = ""
+            mock_result.stdout = b'{"status": "success", "output": "Command completed"}'
+            mock_result.stderr = b""
             mock_subprocess_run.return_value = mock_result
             
             # Simulate signal file appearing after some iterations
@@ -551,7 +555,9 @@ class TestClaudeCommandExecution:
             mock_exists.assert_called_with(expected_signal_path)
             assert mock_exists.call_count == 3, f"Expected 3 calls to os.path.exists, got {mock_exists.call_count}"
             
-            # Verify that os.remove was called to clean up the signal file
+            # Verify that stale signals were cleared before the command and the
+            # signal file was cleaned up after the wait
+            mock_clear_stale.assert_called_once_with(expected_signal_path)
             mock_remove.assert_called_once_with(expected_signal_path)
             
             # Verify the function returns parsed JSON
@@ -577,8 +583,8 @@ class TestClaudeCommandExecution:
         # Mock subprocess.run to return a successful result with JSON output
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = '{"status": "success", "output": "Command executed successfully"}'
-        mock_result.stderr = ""
+        mock_result.stdout = b'{"status": "success", "output": "Command executed successfully"}'
+        mock_result.stderr = b""
         mock_subprocess_run.return_value = mock_result
         
         # Mock signal file to exist immediately (no waiting)
@@ -611,7 +617,7 @@ class TestClaudeCommandExecution:
         # Verify subprocess.run was called with correct keyword arguments
         kwargs = call_args[1]
         assert kwargs.get('capture_output') is True, "capture_output should be True"
-        assert kwargs.get('text') is True, "text should be True"
+        assert 'text' not in kwargs, "output should be captured as raw bytes"
         assert kwargs.get('check') is False, "check should be False to handle errors manually"
         
         # Verify the function returns parsed JSON
@@ -651,8 +657,8 @@ class TestClaudeCommandExecution:
         # Mock subprocess.run to return complex JSON
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps(complex_json_response)
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps(complex_json_response).encode()
+        mock_result.stderr = b""
         mock_subprocess_run.return_value = mock_result
         
         # Mock signal file to exist immediately (no waiting)
@@ -698,8 +704,8 @@ class TestClaudeCommandExecution:
         # Mock subprocess.run to return an error response
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = '{"error": "Command failed", "details": "Invalid command syntax"}'
-        mock_result.stderr = "Claude CLI Error: Command not recognized"
+        mock_result.stdout = b'{"error": "Command failed", "details": "Invalid command syntax"}'
+        mock_result.stderr = b"Claude CLI Error: Command not recognized"
         mock_subprocess_run.return_value = mock_result
         
         # Mock signal file to exist immediately (no waiting)
@@ -1499,15 +1505,16 @@ class TestRefactoringLoop:
 class TestUsageLimitIntegration:
     """Test suite for integrating usage limit handling into run_claude_command."""
     
+    @patch('command_executor.cleanup_signal_file')
     @patch('os.remove')
     @patch('os.path.exists')
-    @patch('time.sleep')
+    @patch('command_executor._wait_for_usage_limit_reset', return_value=True)
     @patch('command_executor.calculate_wait_time')
     @patch('command_executor.parse_usage_limit_error')
     @patch('command_executor.subprocess.run')
     def test_run_claude_command_detects_usage_limit_and_retries_successfully(
             self, mock_subprocess_run, mock_parse_usage_limit, mock_calculate_wait_time, 
-            mock_sleep, mock_exists, mock_remove):
+            mock_wait_reset, mock_exists, mock_remove, mock_clear_stale):
         """
         Test that run_claude_command detects usage limit errors and retries after waiting.
         
@@ -1516,7 +1523,7 @@ class TestUsageLimitIntegration:
         2. run_claude_command detects the usage limit pattern in the output
         3. Calls parse_usage_limit_error to extract reset time information
         4. Calls calculate_wait_time to determine how long to wait
-        5. Calls time.sleep to wait for the specified duration
+        5. Waits (interruptibly) for the specified duration
         6. Retries the subprocess.run call with the same command
         7. Second call succeeds and returns valid JSON output
         8. Function returns the successful result
@@ -1539,13 +1546,13 @@ class TestUsageLimitIntegration:
         # Mock subprocess.run to return usage limit error first, then success
         usage_limit_result = MagicMock()
         usage_limit_result.returncode = 1
-        usage_limit_result.stdout = '{"error": "usage_limit", "message": "You can try again at 7pm (America/Chicago)"}'
-        usage_limit_result.stderr = "Claude API Error: Usage limit exceeded. You can try again at 7pm (America/Chicago)."
+        usage_limit_result.stdout = b'{"error": "usage_limit", "message": "You can try again at 7pm (America/Chicago)"}'
+        usage_limit_result.stderr = b"Claude API Error: Usage limit exceeded. You can try again at 7pm (America/Chicago)."
         
         success_result = MagicMock()
         success_result.returncode = 0
-        success_result.stdout = '{"status": "success", "output": "Command completed after retry"}'
-        success_result.stderr = ""
+        success_result.stdout = b'{"status": "success", "output": "Command completed after retry"}'
+        success_result.stderr = b""
         
         # First call returns usage limit error, second call succeeds
         mock_subprocess_run.side_effect = [usage_limit_result, success_result]
@@ -1600,17 +1607,104 @@ class TestUsageLimitIntegration:
             "format": "natural_language"
         })
         
-        # Verify time.sleep was called with calculated wait time
-        mock_sleep.assert_called_once_with(3600)
+        # Verify the usage limit wait was called with calculated wait time
+        mock_wait_reset.assert_called_once_with(3600)
         
-        # Verify signal file cleanup was performed twice (once per command attempt)
-        assert mock_remove.call_count == 2, f"Expected 2 calls to os.remove (cleanup after each attempt), got {mock_remove.call_count}"
+        # Verify each attempt cleared stale signals before running and cleaned up
+        # after its own completion wait (no second wait for the initial
+        # attempt's already-consumed signal)
+        assert mock_clear_stale.call_count == 2, f"Expected one stale signal clear per attempt, got {mock_clear_stale.call_count}"
+        assert mock_remove.call_count == 2, f"Expected one signal cleanup per attempt, got {mock_remove.call_count}"
+        assert mock_exists.call_count == 2, f"Expected one signal check per attempt, got {mock_exists.call_count}"
         
         # Verify function returns the successful result (from second attempt)
         assert isinstance(result, dict), "Result should be parsed JSON from successful retry"
         assert result["status"] == "success", "Result should be from successful retry attempt"
         assert result["output"] == "Command completed after retry", "Result should contain retry success message"
 
+    def test_usage_limit_wait_sleeps_in_bounded_chunks_until_deadline(self):
+        """
+        Test that the usage limit wait is split into bounded chunks that
+        together cover the full wait against a monotonic deadline.
+        """
+        from command_executor import _wait_for_usage_limit_reset, USAGE_LIMIT_WAIT_INTERRUPT
+        from config import USAGE_LIMIT_WAIT_CHUNK_SECONDS, USAGE_LIMIT_WAIT_JITTER_SECONDS
+        
+        clock = [1000.0]
+        waits = []
+        
+        def fake_wait(timeout):
+            waits.append(timeout)
+            clock[0] += timeout
+            return False
+        
+        with patch('command_executor.time.monotonic', side_effect=lambda: clock[0]), \
+             patch('command_executor.random.uniform', return_value=0.0), \
+             patch.object(USAGE_LIMIT_WAIT_INTERRUPT, 'wait', side_effect=fake_wait):
+            assert _wait_for_usage_limit_reset(100) is True
+        
+        assert sum(waits) == pytest.approx(100)
+        assert all(w <= USAGE_LIMIT_WAIT_CHUNK_SECONDS + USAGE_LIMIT_WAIT_JITTER_SECONDS for w in waits)
+        assert len(waits) == 4, f"Expected 100s to be split into 4 chunks, got {waits}"
+    
+    def test_usage_limit_wait_aborts_when_interrupted(self):
+        """
+        Test that a shutdown request interrupts the usage limit wait and that
+        the retry workflow raises instead of retrying the command.
+        """
+        from command_executor import (
+            _wait_for_usage_limit_reset, _handle_usage_limit_and_retry,
+            USAGE_LIMIT_WAIT_INTERRUPT, CommandExecutionError
+        )
+        
+        USAGE_LIMIT_WAIT_INTERRUPT.set()
+        try:
+            assert _wait_for_usage_limit_reset(3600) is False
+            
+            usage_limit_result = MagicMock()
+            usage_limit_result.stdout = b""
+            usage_limit_result.stderr = b"Usage limit exceeded. You can try again at 7pm (America/Chicago)."
+            
+            with patch('command_executor.calculate_wait_time', return_value=3600), \
+                 patch('command_executor._execute_claude_subprocess') as mock_subprocess:
+                with pytest.raises(CommandExecutionError, match="interrupted by shutdown"):
+                    _handle_usage_limit_and_retry("/continue", ["claude"], usage_limit_result)
+                mock_subprocess.assert_not_called()
+        finally:
+            USAGE_LIMIT_WAIT_INTERRUPT.clear()
+    
+    def test_run_claude_command_does_not_relaunch_cli_after_interrupted_wait(self, tmp_path, monkeypatch):
+        """
+        Test that when a shutdown interrupts the usage limit wait, the retry
+        decorator around run_claude_command does not launch the CLI again.
+        """
+        from command_executor import (
+            run_claude_command, USAGE_LIMIT_WAIT_INTERRUPT, ShutdownInterruptedError
+        )
+        monkeypatch.chdir(tmp_path)
+        
+        usage_limit_result = MagicMock()
+        usage_limit_result.returncode = 1
+        usage_limit_result.stdout = b""
+        usage_limit_result.stderr = b"Usage limit exceeded. You can try again at 7pm (America/Chicago)."
+        
+        USAGE_LIMIT_WAIT_INTERRUPT.set()
+        try:
+            with patch('command_executor._execute_claude_subprocess',
+                       return_value=usage_limit_result) as mock_subprocess, \
+                 patch('command_executor.wait_for_signal_file'), \
+                 patch('command_executor.calculate_wait_time', return_value=3600), \
+                 patch('command_executor.time.sleep') as mock_sleep:
+                with pytest.raises(ShutdownInterruptedError, match="interrupted by shutdown"):
+                    run_claude_command("/continue")
+            
+            assert mock_subprocess.call_count == 1, (
+                f"CLI should run once and not be relaunched after shutdown, ran {mock_subprocess.call_count} times"
+            )
+            mock_sleep.assert_not_called()
+        finally:
+            USAGE_LIMIT_WAIT_INTERRUPT.clear()
+
 
 class TestUsageLimitParsing:
     """Test suite for usage limit error parsing functionality."""
@@ -1840,6 +1934,32 @@ class TestUsageLimitParsing:
         # When reset time is earlier same day, should calculate time until reset time next day
         assert evening_result > 20 * 3600, f"Reset time earlier same day should wait until next day (>20 hours), got: {evening_result} seconds"
         assert evening_result <= 24 * 3600, f"Wait time should not exceed 24 hours, got: {evening_result} seconds"
+    
+    def test_parse_time_string_table_and_fallback_hours(self):
+        """
+        Test that canonical spellings answered from the precomputed hour table
+        and non-canonical spellings handled by the fallback parser both give
+        the expected 24-hour values, and invalid values still raise.
+        """
+        from usage_limit import _parse_time_string_to_24hour
+        
+        table_cases = {
+            "1am": 1, "7am": 7, "11am": 11, "12am": 0,
+            "1pm": 13, "7pm": 19, "11pm": 23, "12pm": 12,
+            "0": 0, "9": 9, "19": 19, "23": 23,
+        }
+        for time_str, expected_hour in table_cases.items():
+            assert _parse_time_string_to_24hour(time_str) == expected_hour, time_str
+        
+        fallback_cases = {
+            " 12AM ": 0, "7PM": 19, "07pm": 19, "7 pm": 19, "007am": 7, " 05 ": 5,
+        }
+        for time_str, expected_hour in fallback_cases.items():
+            assert _parse_time_string_to_24hour(time_str) == expected_hour, time_str
+        
+        for invalid in ("13pm", "24", "-1", "soon", ""):
+            with pytest.raises(ValueError):
+                _parse_time_string_to_24hour(invalid)
 
 
 class TestDependencyInjection:
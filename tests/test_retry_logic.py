@@ -94,8 +94,8 @@ class TestExponentialBackoffRetryLogic:
             # Configure subprocess to fail 3 times, then succeed
             subprocess_error = subprocess.SubprocessError("Network connection failed")
             success_result = Mock()
-            success_result.stdout = '{"status": "success", "output": "Command completed"}'
-            success_result.stderr = ""
+            success_result.stdout = b'{"status": "success", "output": "Command completed"}'
+            success_result.stderr = b""
             success_result.returncode = 0
             
             mock_subprocess.side_effect = [
@@ -205,8 +205,8 @@ class TestExponentialBackoffRetryLogic:
             
             # Configure subprocess to return invalid JSON (permanent failure)
             bad_result = Mock()
-            bad_result.stdout = 'invalid json response'
-            bad_result.stderr = ""
+            bad_result.stdout = b'invalid json response'
+            bad_result.stderr = b""
             bad_result.returncode = 0
             mock_subprocess.return_value = bad_result
             
@@ -248,8 +248,8 @@ class TestExponentialBackoffRetryLogic:
             # Configure subprocess to fail twice then succeed  
             subprocess_error = subprocess.SubprocessError("Network error")
             success_result = Mock()
-            success_result.stdout = '{"status": "success"}'
-            success_result.stderr = ""
+            success_result.stdout = b'{"status": "success"}'
+            success_result.stderr = b""
             mock_subprocess.side_effect = [subprocess_error, subprocess_error, success_result]
             
             # Execute command
@@ -301,8 +301,8 @@ class TestExponentialBackoffRetryLogic:
             # Configure two failures then success
             subprocess_error = subprocess.SubprocessError("Connection timeout")
             success_result = Mock()
-            success_result.stdout = '{"status": "success"}'
-            success_result.stderr = ""
+            success_result.stdout = b'{"status": "success"}'
+            success_result.stderr = b""
             mock_subprocess.side_effect = [subprocess_error, subprocess_error, success_result]
             
             # Execute command without retry_config parameter (should use defaults)
@@ -353,8 +353,8 @@ class TestExponentialBackoffRetryLogic:
             # Configure one failure then success
             subprocess_error = subprocess.SubprocessError("Network timeout")
             success_result = Mock()
-            success_result.stdout = '{"status": "success"}'
-            success_result.stderr = ""
+            success_result.stdout = b'{"status": "success"}'
+            success_result.stderr = b""
             mock_subprocess.side_effect = [subprocess_error, success_result]
             
             # Execute command
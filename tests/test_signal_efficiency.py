@@ -14,9 +14,6 @@ import logging
 from unittest.mock import patch, Mock, call
 from pathlib import Path
 
-# Add parent directory to path so we can import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 from signal_handler import wait_for_signal_file
 from config import LOGGERS
@@ -83,12 +80,12 @@ class TestSignalHandlingEfficiency:
             """Mock os.remove that does nothing but prevents errors."""
             pass
         
-        # Mock time.time to provide controlled elapsed time calculation
+        # Mock time.monotonic to provide controlled elapsed time calculation
         start_time = 1000.0
         time_calls = [start_time]  # First call returns start time
         
         def mock_time():
-            """Mock time.time that simulates passage of time based on sleep calls."""
+            """Mock time.monotonic that simulates passage of time based on sleep calls."""
             if len(time_calls) == 1:
                 return start_time
             else:
@@ -99,7 +96,8 @@ class TestSignalHandlingEfficiency:
         with patch('time.sleep', side_effect=mock_sleep), \
              patch('os.path.exists', side_effect=mock_exists), \
              patch('os.remove', side_effect=mock_remove), \
-             patch('time.time', side_effect=mock_time):
+             patch('time.monotonic', side_effect=mock_time), \
+             patch('signal_handler._open_directory_watch', return_value=None):
             
             # Call wait_for_signal_file with exponential backoff parameters
             # This should use new parameters: min_interval=0.1, max_interval=2.0
@@ -178,4 +176,95 @@ class TestSignalHandlingEfficiency:
             f"Current parameters: {list(function_params)}. "
             f"Expected parameters: signal_file_path, timeout, min_interval, max_interval, debug. "
             f"This indicates that exponential backoff has not been implemented yet."
-        )
\ No newline at end of file
+        )
+    
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux-only")
+    def test_wait_for_signal_file_wakes_on_directory_event(self, tmp_path):
+        """
+        Test that on Linux the wait ends as soon as the signal file is created,
+        rather than after the current backoff interval.
+        
+        The file is created by another thread shortly after the wait starts
+        with a 5 second backoff interval; the wait should return well before
+        that interval elapses and remove the file.
+        """
+        import threading
+        import signal_handler
+        
+        if signal_handler._LIBC is None:
+            pytest.skip("inotify unavailable in this environment")
+        
+        signal_file_path = tmp_path / "signal_task_complete"
+        timer = threading.Timer(0.2, signal_file_path.touch)
+        
+        start = time.monotonic()
+        timer.start()
+        try:
+            wait_for_signal_file(signal_file_path, timeout=10.0, min_interval=5.0, max_interval=5.0)
+        finally:
+            timer.cancel()
+        elapsed = time.monotonic() - start
+        
+        assert elapsed < 2.0, f"Wait should end on the creation event, took {elapsed:.2f}s"
+        assert not signal_file_path.exists(), "Signal file should be removed after the wait"
+    
+    def test_full_jitter_decorrelates_intervals_at_the_cap(self):
+        """
+        Test that jittered intervals are drawn from the whole range below the
+        backoff cap, instead of converging on max_interval.
+        """
+        from signal_handler import _calculate_next_interval
+        
+        plateau = [_calculate_next_interval(10, 0.1, 2.0, jitter=True) for _ in range(200)]
+        assert all(0.05 <= interval <= 2.0 for interval in plateau)
+        assert min(plateau) < 1.0, f"Jittered intervals should spread well below the cap: {min(plateau)}"
+        assert len(set(plateau)) > 100, "Jittered intervals at the cap should not repeat"
+        
+        early = [_calculate_next_interval(1, 0.1, 2.0, jitter=True) for _ in range(50)]
+        assert all(0.05 <= interval <= 0.2 for interval in early)
+        
+        assert _calculate_next_interval(10, 0.1, 2.0) == 2.0
+    
+    def test_cleanup_signal_file_removes_without_existence_check(self, tmp_path):
+        """
+        Test that cleanup_signal_file removes the file with a single remove
+        call and treats an already-missing file as cleaned up.
+        """
+        from signal_handler import cleanup_signal_file
+        
+        signal_file_path = tmp_path / "signal_task_complete"
+        signal_file_path.touch()
+        
+        with patch('os.path.exists') as mock_exists:
+            cleanup_signal_file(signal_file_path)
+            cleanup_signal_file(signal_file_path)
+        
+        mock_exists.assert_not_called()
+        assert not signal_file_path.exists()
+        LOGGERS['command_executor'].warning.assert_not_called()
+    
+    def test_wait_never_sleeps_past_the_timeout(self):
+        """
+        Test that the final wait is clamped to the time left before the
+        timeout instead of sleeping a full backoff interval beyond it, and
+        that the file is checked one last time at the deadline.
+        """
+        clock = [0.0]
+        sleep_calls = []
+        
+        def mock_sleep(duration):
+            sleep_calls.append(duration)
+            clock[0] += duration
+        
+        with patch('time.sleep', side_effect=mock_sleep), \
+             patch('time.monotonic', side_effect=lambda: clock[0]), \
+             patch('os.path.exists', return_value=False) as mock_exists, \
+             patch('signal_handler._open_directory_watch', return_value=None):
+            with pytest.raises(TimeoutError):
+                wait_for_signal_file("missing_signal_file", timeout=3.0, min_interval=0.1, max_interval=2.0)
+        
+        assert mock_exists.call_count == len(sleep_calls) + 1, "The file should be checked once more at the deadline"
+        
+        assert sleep_calls[:4] == [0.1, 0.2, 0.4, 0.8]
+        assert sleep_calls[4] == pytest.approx(1.5), f"Last wait should be clamped to the remaining time: {sleep_calls}"
+        assert sum(sleep_calls) == pytest.approx(3.0)
@@ -5,11 +5,6 @@ This test file verifies that TaskTracker can be imported from a separate task_tr
 and that it maintains the expected interface and functionality when extracted from automate_dev.py.
 """
 
-import sys
-import os
-# Add parent directory to path so we can import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 
 
@@ -13,14 +13,9 @@ This test follows the FIRST principles:
 - Timely: Written before the type hints are implemented
 """
 
-import sys
-import os
 import inspect
 from typing import Dict, Any, Callable, Optional, Tuple
 
-# Add parent directory to path so we can import the module
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import pytest
 
 
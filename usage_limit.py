@@ -204,13 +204,11 @@ def _calculate_unix_timestamp_wait(parsed_reset_info: UsageLimitUnixResult) -> i
     return wait_seconds
 
 
-def _parse_time_string_to_24hour(reset_time_str: str) -> int:
-    """Parse time string and convert to 24-hour format.
-    
-    Handles formats like "7pm", "7am", "19", "7:30pm" etc.
+def _convert_time_string_to_24hour(reset_time_str: str) -> int:
+    """Convert a normalized (lowercase, stripped) time string to a 24-hour hour.
     
     Args:
-        reset_time_str: Time string to parse
+        reset_time_str: Normalized time string such as "7pm", "7am" or "19"
         
     Returns:
         Hour in 24-hour format (0-23)
@@ -218,8 +216,6 @@ def _parse_time_string_to_24hour(reset_time_str: str) -> int:
     Raises:
         ValueError: If time string format is invalid
     """
-    reset_time_str = reset_time_str.lower().strip()
-    
     try:
         if reset_time_str.endswith("pm"):
             hour = int(reset_time_str[:-2])
@@ -242,6 +238,41 @@ def _parse_time_string_to_24hour(reset_time_str: str) -> int:
         raise ValueError(f"Invalid time format '{reset_time_str}': {e}")
 
 
+# Hours for the canonical spellings ("1am".."12pm", "0".."23"), built once with the
+# converter above so lookups and the fallback parse can never disagree
+_HOUR_LOOKUP: Dict[str, int] = {
+    time_str: _convert_time_string_to_24hour(time_str)
+    for time_str in (
+        [f"{hour}{suffix}" for suffix in ("am", "pm") for hour in range(1, 13)]
+        + [str(hour) for hour in range(24)]
+    )
+}
+
+
+def _parse_time_string_to_24hour(reset_time_str: str) -> int:
+    """Parse time string and convert to 24-hour format.
+    
+    Handles formats like "7pm", "7am", "19", "7:30pm" etc. Canonical
+    spellings are answered from a precomputed table; anything else falls
+    back to the full parser.
+    
+    Args:
+        reset_time_str: Time string to parse
+        
+    Returns:
+        Hour in 24-hour format (0-23)
+        
+    Raises:
+        ValueError: If time string format is invalid
+    """
+    reset_time_str = reset_time_str.lower().strip()
+    
+    hour = _HOUR_LOOKUP.get(reset_time_str)
+    if hour is not None:
+        return hour
+    return _convert_time_string_to_24hour(reset_time_str)
+
+
 def _calculate_natural_language_wait(parsed_reset_info: UsageLimitNaturalResult) -> int:
     """Calculate wait time for natural language format.
     